@@ -4,6 +4,7 @@ Coordinates all modules for parity arbitrage execution.
 """
 
 import asyncio
+import logging
 import signal
 import time
 from decimal import Decimal
@@ -19,6 +20,7 @@ from .positions import PositionManager, PairedPosition
 from .risk import RiskManager
 from .monitor import Logger, MetricsCollector
 from .storage import Database
+from .units import from_micros, to_micros
 
 
 class ArbitrageBot:
@@ -46,6 +48,7 @@ class ArbitrageBot:
             name="arb_bot",
             level=self.config.log_level,
             log_file=self.config.log_file,
+            file_timestamp_format=self.config.log_timestamp_format,
         )
         
         self.auth = AuthManager(
@@ -81,14 +84,14 @@ class ArbitrageBot:
         
         self.convergence_detector = ConvergenceDetector(
             orderbook_manager=self.orderbook,
-            convergence_threshold=Decimal(str(self.config.trading.convergence_threshold)),
+            convergence_threshold=self.config.trading.convergence_threshold,
         )
         
         # Spot-lag detector
         self.spot_feed = BinanceSpotFeed()
         self.spot_lag_detector = SpotLagDetector(
             spot_feed=self.spot_feed,
-            min_edge=Decimal(str(self.config.trading.min_edge)),
+            min_edge=self.config.trading.min_edge,
             min_spot_move=Decimal("0.1"),  # 0.1% minimum spot move
         )
         
@@ -177,9 +180,11 @@ class ArbitrageBot:
         except Exception as e:
             self.logger.error("cancel_orders_failed", error=str(e))
         
-        # Save state
+        # Save state; close() flushes the write-behind queue
         await self._save_state()
+        self.database.close()
         
+        self.risk_manager.shutdown()
         self.logger.shutdown()
     
     async def _load_state(self) -> None:
@@ -187,19 +192,20 @@ class ArbitrageBot:
         # Load open positions
         positions = self.database.get_open_positions()
         for pos in positions:
-            self.position_manager.add_position(pos)
+            self.position_manager.add_position(PairedPosition.from_stored(pos))
         
         self.logger.info("state_loaded", open_positions=len(positions))
     
     async def _save_state(self) -> None:
         """Save state to database."""
-        # Save all positions
-        for pos in self.position_manager.get_all_positions():
-            self.database.save_position(pos)
+        # Save all positions in one transaction
+        self.database.save_positions_bulk(
+            pos.to_stored() for pos in self.position_manager.get_all_positions()
+        )
         
         # Save metrics
         metrics = self.metrics.get_session_metrics()
-        self.database.save_state("last_session_metrics", metrics)
+        self.database.save_state_async("last_session_metrics", metrics)
         
         self.logger.info("state_saved")
     
@@ -256,13 +262,15 @@ class ArbitrageBot:
                 asks=len(update.asks),
             )
         
-        def on_price_change(update: PriceChange) -> None:
-            self.orderbook.update_price_level(
-                token_id=update.asset_id,
-                side=update.side,
-                price=update.price,
-                size=update.size,
-            )
+        def on_price_change_batch(updates: list[PriceChange]) -> None:
+            # One book write (and one timestamp) per asset per message
+            by_asset: dict[str, list[tuple[str, Decimal, Decimal]]] = {}
+            for update in updates:
+                by_asset.setdefault(update.asset_id, []).append(
+                    (update.side, update.price, update.size)
+                )
+            for asset_id, levels in by_asset.items():
+                self.orderbook.update_levels_batch(asset_id, levels)
         
         def on_best_bid_ask(update: BestBidAsk) -> None:
             self.orderbook.update_best_bid_ask(
@@ -286,7 +294,7 @@ class ArbitrageBot:
             self.metrics.record_api_error()
         
         self.ws_client.on_book(on_book)
-        self.ws_client.on_price_change(on_price_change)
+        self.ws_client.on_price_change_batch(on_price_change_batch)
         self.ws_client.on_best_bid_ask(on_best_bid_ask)
         self.ws_client.on_connected(on_connected)
         self.ws_client.on_disconnected(on_disconnected)
@@ -319,11 +327,13 @@ class ArbitrageBot:
                 risk_check = self.risk_manager.check_can_trade()
                 
                 if not risk_check.passed:
-                    self.logger.debug(
-                        "trading_blocked",
-                        violation=risk_check.violation.value if risk_check.violation else None,
-                        message=risk_check.message,
-                    )
+                    # Reading .message formats it, so only do so when debug is on
+                    if self.logger.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            "trading_blocked",
+                            violation=risk_check.violation.value if risk_check.violation else None,
+                            message=risk_check.message,
+                        )
                     await asyncio.sleep(scan_interval)
                     continue
                 
@@ -377,7 +387,7 @@ class ArbitrageBot:
                 # Success - create position
                 position = PairedPosition.from_execution(result)
                 self.position_manager.add_position(position)
-                self.database.save_position(position)
+                self.database.save_position(position.to_stored())
                 
                 self.metrics.record_trade_success(
                     execution_id=result.execution_id,
@@ -402,7 +412,7 @@ class ArbitrageBot:
                 if result.actual_filled_size > 0:
                     position = PairedPosition.from_execution(result)
                     self.position_manager.add_position(position)
-                    self.database.save_position(position)
+                    self.database.save_position(position.to_stored())
                 
                 self.metrics.record_trade_partial(
                     result.execution_id,
@@ -455,25 +465,19 @@ class ArbitrageBot:
                                 price=str(spot_data.price),
                             )
                 
-                # Update PM prices in detector from orderbook
-                for market in self.orderbook.get_all_markets():
-                    yes_bid = market.yes_book.best_bid or Decimal("0")
-                    yes_ask = market.yes_book.best_ask or Decimal("1")
-                    no_bid = market.no_book.best_bid or Decimal("0")
-                    no_ask = market.no_book.best_ask or Decimal("1")
-                    
-                    # Determine symbol from market (check all registered)
-                    for symbol in ["btc", "eth", "sol"]:
-                        market_info = self.spot_lag_detector._market_tokens.get(symbol)
-                        if market_info and market_info["condition_id"] == market.condition_id:
-                            self.spot_lag_detector.update_pm_prices(
-                                symbol=symbol,
-                                up_bid=yes_bid,
-                                up_ask=yes_ask,
-                                down_bid=no_bid,
-                                down_ask=no_ask,
-                            )
-                            break
+                # Update PM prices in detector from orderbook, one row per registered symbol
+                pm_updates = []
+                for symbol, market_info in self.spot_lag_detector._market_tokens.items():
+                    market = self.orderbook.get_market(market_info["condition_id"])
+                    if market:
+                        pm_updates.append((
+                            symbol,
+                            market.yes_book.best_bid or Decimal("0"),
+                            market.yes_book.best_ask or Decimal("1"),
+                            market.no_book.best_bid or Decimal("0"),
+                            market.no_book.best_ask or Decimal("1"),
+                        ))
+                self.spot_lag_detector.update_pm_prices_batch(pm_updates)
                 
                 # Scan for opportunities
                 signals = self.spot_lag_detector.scan_all()
@@ -523,7 +527,7 @@ class ArbitrageBot:
                 return
             
             # Determine size based on edge and max notional
-            max_notional = Decimal(str(self.config.trading.max_notional_per_trade))
+            max_notional = self.config.trading.max_notional_per_trade
             size = max_notional / signal.recommended_price
             size = min(size, signal.max_size)
             
@@ -568,11 +572,12 @@ class ArbitrageBot:
         
         while self._running:
             try:
-                for position in self.position_manager.get_open_positions():
-                    should_exit, reason = self.convergence_detector.should_exit(
-                        position.condition_id
-                    )
-                    
+                positions = self.position_manager.get_open_positions()
+                decisions = self.convergence_detector.batch_should_exit(
+                    [position.condition_id for position in positions]
+                )
+                
+                for position, (should_exit, reason) in zip(positions, decisions):
                     if should_exit:
                         self.logger.info(
                             "exit_triggered",
@@ -596,7 +601,7 @@ class ArbitrageBot:
                 condition_id=position.condition_id,
                 yes_token_id=position.yes_token_id,
                 no_token_id=position.no_token_id,
-                size=position.size,
+                size=from_micros(position.size),
             )
             
             if result.status == ExecutionStatus.COMPLETE:
@@ -605,17 +610,19 @@ class ArbitrageBot:
                     result.no_leg.price * result.no_leg.filled_size
                 )
                 
-                position.close(
-                    yes_exit_price=result.yes_leg.price,
-                    no_exit_price=result.no_leg.price,
-                    exit_proceeds=exit_proceeds,
+                self.position_manager.close_position(
+                    position.position_id,
+                    yes_exit_price=to_micros(result.yes_leg.price),
+                    no_exit_price=to_micros(result.no_leg.price),
+                    exit_proceeds=to_micros(exit_proceeds),
                 )
+                realized_pnl = from_micros(position.realized_pnl)
                 
-                self.database.save_position(position)
+                self.database.save_position(position.to_stored())
                 
                 self.metrics.record_position_closed(
                     execution_id=position.position_id,
-                    realized_pnl=position.realized_pnl,
+                    realized_pnl=realized_pnl,
                     holding_time_seconds=position.holding_time_seconds,
                 )
                 
@@ -624,7 +631,7 @@ class ArbitrageBot:
                 self.logger.position_closed(
                     position_id=position.position_id,
                     condition_id=position.condition_id,
-                    realized_pnl=str(position.realized_pnl),
+                    realized_pnl=str(realized_pnl),
                     holding_time_seconds=position.holding_time_seconds,
                 )
                 
@@ -638,29 +645,44 @@ class ArbitrageBot:
     async def _health_check_loop(self) -> None:
         """Periodic health checks."""
         interval = self.config.risk.health_check_interval_seconds
+        next_deadline = time.monotonic() + interval
         
         while self._running:
             try:
                 health = self.risk_manager.run_health_check()
                 self.logger.health_check(health["healthy"], health.get("issues", []))
-                
-                await asyncio.sleep(interval)
-                
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error("health_check_error", error=str(e))
-                await asyncio.sleep(interval)
+            
+            # Fixed cadence on the monotonic clock, independent of check time
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now
+            try:
+                await asyncio.sleep(next_deadline - now)
+            except asyncio.CancelledError:
+                break
+            next_deadline += interval
     
     async def _state_save_loop(self) -> None:
-        """Periodic state saves."""
+        """Periodic state saves and WAL checkpoints."""
         interval = 60  # Save every minute
+        checkpoint_every = 10  # Checkpoint every 10 saves
+        saves = 0
         
         while self._running:
             try:
                 await asyncio.sleep(interval)
+                if not self._running:
+                    break  # stop() already saved state and closed the database
                 await self._save_state()
                 
+                saves += 1
+                if saves % checkpoint_every == 0:
+                    self.database.checkpoint()
+                
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -5,6 +5,7 @@ All secrets via environment variables. All tunable parameters externalized.
 
 import os
 from dataclasses import dataclass, field
+from decimal import Decimal
 from typing import Optional
 
 
@@ -21,38 +22,38 @@ class MarketConfig:
 @dataclass
 class FeeConfig:
     """Fee model configuration. Polymarket currently has 0 maker/taker fees for most markets."""
-    maker_fee_bps: float = 0.0
-    taker_fee_bps: float = 0.0
+    maker_fee_bps: Decimal = Decimal("0")
+    taker_fee_bps: Decimal = Decimal("0")
     
     @property
-    def maker_fee_rate(self) -> float:
-        return self.maker_fee_bps / 10000.0
+    def maker_fee_rate(self) -> Decimal:
+        return self.maker_fee_bps / 10000
     
     @property
-    def taker_fee_rate(self) -> float:
-        return self.taker_fee_bps / 10000.0
+    def taker_fee_rate(self) -> Decimal:
+        return self.taker_fee_bps / 10000
 
 
 @dataclass
 class TradingConfig:
-    """Trading parameters."""
-    min_edge: float = 0.005  # Minimum edge to execute (0.5%)
-    slippage_buffer: float = 0.002  # Slippage buffer (0.2%)
-    min_spot_move: float = 0.1  # Minimum spot price move to trigger (0.1%)
-    max_notional_per_trade: float = 100.0  # Max USDC per trade
+    """Trading parameters. Prices and amounts are Decimal, parsed once at load."""
+    min_edge: Decimal = Decimal("0.005")  # Minimum edge to execute (0.5%)
+    slippage_buffer: Decimal = Decimal("0.002")  # Slippage buffer (0.2%)
+    min_spot_move: Decimal = Decimal("0.1")  # Minimum spot price move to trigger (0.1%)
+    max_notional_per_trade: Decimal = Decimal("100")  # Max USDC per trade
     max_open_pairs: int = 5  # Max concurrent paired positions
     cooldown_ms: int = 1000  # Cooldown between trades in ms
     order_timeout_seconds: int = 30  # Order timeout
-    convergence_threshold: float = 0.001  # Exit when spread < this
+    convergence_threshold: Decimal = Decimal("0.001")  # Exit when spread < this
 
 
 @dataclass
 class RiskConfig:
-    """Risk management parameters."""
-    max_daily_loss: float = 500.0  # Max daily loss in USDC
-    max_position_value: float = 1000.0  # Max total position value
+    """Risk management parameters. USDC amounts are Decimal."""
+    max_daily_loss: Decimal = Decimal("500")  # Max daily loss in USDC
+    max_position_value: Decimal = Decimal("1000")  # Max total position value
     health_check_interval_seconds: int = 30
-    kill_switch_loss_threshold: float = 200.0  # Immediate halt threshold
+    kill_switch_loss_threshold: Decimal = Decimal("200")  # Immediate halt threshold
     max_consecutive_failures: int = 10
 
 
@@ -95,6 +96,7 @@ class Config:
     # Logging
     log_level: str = field(default_factory=lambda: os.environ.get("LOG_LEVEL", "INFO"))
     log_file: str = field(default_factory=lambda: os.environ.get("LOG_FILE", "arb_bot.log"))
+    log_timestamp_format: str = field(default_factory=lambda: os.environ.get("LOG_TIMESTAMP_FORMAT", "epoch"))
     
     # Database
     db_path: str = field(default_factory=lambda: os.environ.get("DB_PATH", "arb_bot.db"))
@@ -115,6 +117,8 @@ class Config:
             errors.append("slippage_buffer cannot be negative")
         if self.trading.max_notional_per_trade <= 0:
             errors.append("max_notional_per_trade must be positive")
+        if self.log_timestamp_format not in ("iso", "epoch"):
+            errors.append("LOG_TIMESTAMP_FORMAT must be 'iso' or 'epoch'")
             
         return errors
 
@@ -140,11 +144,11 @@ def load_config_from_env() -> Config:
     
     # Override trading params from env
     if os.environ.get("MIN_EDGE"):
-        config.trading.min_edge = float(os.environ["MIN_EDGE"])
+        config.trading.min_edge = Decimal(os.environ["MIN_EDGE"])
     if os.environ.get("SLIPPAGE_BUFFER"):
-        config.trading.slippage_buffer = float(os.environ["SLIPPAGE_BUFFER"])
+        config.trading.slippage_buffer = Decimal(os.environ["SLIPPAGE_BUFFER"])
     if os.environ.get("MAX_NOTIONAL_PER_TRADE"):
-        config.trading.max_notional_per_trade = float(os.environ["MAX_NOTIONAL_PER_TRADE"])
+        config.trading.max_notional_per_trade = Decimal(os.environ["MAX_NOTIONAL_PER_TRADE"])
     if os.environ.get("MAX_OPEN_PAIRS"):
         config.trading.max_open_pairs = int(os.environ["MAX_OPEN_PAIRS"])
     if os.environ.get("COOLDOWN_MS"):
@@ -152,14 +156,14 @@ def load_config_from_env() -> Config:
     
     # Override fee params from env
     if os.environ.get("MAKER_FEE_BPS"):
-        config.fees.maker_fee_bps = float(os.environ["MAKER_FEE_BPS"])
+        config.fees.maker_fee_bps = Decimal(os.environ["MAKER_FEE_BPS"])
     if os.environ.get("TAKER_FEE_BPS"):
-        config.fees.taker_fee_bps = float(os.environ["TAKER_FEE_BPS"])
+        config.fees.taker_fee_bps = Decimal(os.environ["TAKER_FEE_BPS"])
     
     # Override risk params from env
     if os.environ.get("MAX_DAILY_LOSS"):
-        config.risk.max_daily_loss = float(os.environ["MAX_DAILY_LOSS"])
+        config.risk.max_daily_loss = Decimal(os.environ["MAX_DAILY_LOSS"])
     if os.environ.get("KILL_SWITCH_LOSS_THRESHOLD"):
-        config.risk.kill_switch_loss_threshold = float(os.environ["KILL_SWITCH_LOSS_THRESHOLD"])
+        config.risk.kill_switch_loss_threshold = Decimal(os.environ["KILL_SWITCH_LOSS_THRESHOLD"])
     
     return config
@@ -86,6 +86,7 @@ class PolymarketWebSocketClient:
         # Callbacks
         self._on_book: Optional[Callable[[BookUpdate], None]] = None
         self._on_price_change: Optional[Callable[[PriceChange], None]] = None
+        self._on_price_change_batch: Optional[Callable[[list[PriceChange]], None]] = None
         self._on_best_bid_ask: Optional[Callable[[BestBidAsk], None]] = None
         self._on_error: Optional[Callable[[Exception], None]] = None
         self._on_connected: Optional[Callable[[], None]] = None
@@ -102,6 +103,10 @@ class PolymarketWebSocketClient:
         """Register callback for price changes."""
         self._on_price_change = callback
     
+    def on_price_change_batch(self, callback: Callable[[list[PriceChange]], None]) -> None:
+        """Register callback receiving all price changes from one message."""
+        self._on_price_change_batch = callback
+    
     def on_best_bid_ask(self, callback: Callable[[BestBidAsk], None]) -> None:
         """Register callback for best bid/ask updates."""
         self._on_best_bid_ask = callback
@@ -213,19 +218,28 @@ class PolymarketWebSocketClient:
                 self._on_book(update)
         
         elif event_type == "price_change":
-            if self._on_price_change:
-                for change in data.get("price_changes", []):
-                    update = PriceChange(
+            if self._on_price_change or self._on_price_change_batch:
+                market = data.get("market", "")
+                timestamp = int(data.get("timestamp", 0))
+                updates = [
+                    PriceChange(
                         asset_id=change.get("asset_id", ""),
-                        market=data.get("market", ""),
+                        market=market,
                         price=Decimal(change.get("price", "0")),
                         size=Decimal(change.get("size", "0")),
                         side=change.get("side", ""),
                         best_bid=Decimal(change.get("best_bid", "0")),
                         best_ask=Decimal(change.get("best_ask", "0")),
-                        timestamp=int(data.get("timestamp", 0)),
+                        timestamp=timestamp,
                     )
-                    self._on_price_change(update)
+                    for change in data.get("price_changes", [])
+                ]
+                if self._on_price_change_batch:
+                    if updates:
+                        self._on_price_change_batch(updates)
+                else:
+                    for update in updates:
+                        self._on_price_change(update)
         
         elif event_type == "best_bid_ask":
             if self._on_best_bid_ask:
@@ -9,7 +9,7 @@ import sys
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 
 class LogLevel(Enum):
@@ -21,26 +21,49 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
+# Compact encoder built once; json.dumps() with non-default separators
+# would construct a new encoder per record
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+TimestampFormat = Literal["iso", "epoch"]
+
+
 class JSONFormatter(logging.Formatter):
-    """Format log records as JSON."""
+    """
+    Format log records as JSON.
+    
+    timestamp_format "iso" writes an ISO 8601 UTC string; "epoch" writes
+    float seconds, which is cheaper to produce and to parse downstream.
+    """
+    
+    def __init__(self, timestamp_format: TimestampFormat = "iso"):
+        super().__init__()
+        self.epoch_timestamps = timestamp_format == "epoch"
     
     def format(self, record: logging.LogRecord) -> str:
+        if self.epoch_timestamps:
+            timestamp = record.created
+        else:
+            timestamp = datetime.utcfromtimestamp(record.created).isoformat() + "Z"
+        
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": timestamp,
             "level": record.levelname,
             "event": record.msg,
             "logger": record.name,
         }
         
         # Add extra fields
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+        extra_fields = getattr(record, "extra_fields", None)
+        if extra_fields:
+            log_data.update(extra_fields)
         
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return _encode_json(log_data)
 
 
 class Logger:
@@ -48,7 +71,8 @@ class Logger:
     Structured JSON logger for the arbitrage bot.
     
     All log entries are JSON objects with:
-    - timestamp: ISO 8601 UTC timestamp
+    - timestamp: ISO 8601 UTC timestamp (console) or epoch seconds (file,
+      unless file_timestamp_format="iso")
     - level: Log level
     - event: Event name/type
     - Additional context fields
@@ -59,27 +83,30 @@ class Logger:
         name: str = "arb_bot",
         level: str = "INFO",
         log_file: Optional[str] = None,
+        file_timestamp_format: TimestampFormat = "epoch",
     ):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, level.upper()))
         self.logger.handlers = []  # Clear existing handlers
         
-        # JSON formatter
-        formatter = JSONFormatter()
-        
-        # Console handler
+        # Console handler (human-readable timestamps)
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(JSONFormatter("iso"))
         self.logger.addHandler(console_handler)
         
-        # File handler (optional)
+        # File handler (optional); carries the bulk of log volume
         if log_file:
             file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(JSONFormatter(file_timestamp_format))
             self.logger.addHandler(file_handler)
     
     def _log(self, level: int, event: str, **kwargs: Any) -> None:
         """Internal log method."""
+        # Disabled levels (debug in production) skip record creation
+        # and JSON formatting entirely
+        if not self.logger.isEnabledFor(level):
+            return
+        
         record = self.logger.makeRecord(
             self.logger.name,
             level,
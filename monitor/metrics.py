@@ -3,12 +3,14 @@ Metrics collection for monitoring bot performance.
 """
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from decimal import Decimal
+from itertools import islice
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeMetrics:
     """Metrics for a single trade."""
     execution_id: str
@@ -22,7 +24,7 @@ class TradeMetrics:
     success: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetrics:
     """Metrics for a trading session."""
     start_time: float = field(default_factory=time.time)
@@ -56,13 +58,20 @@ class SessionMetrics:
 class MetricsCollector:
     """
     Collects and aggregates metrics for the arbitrage bot.
+    
+    Per-trade history is bounded; session averages are kept as running
+    totals so they still cover the whole session.
     """
     
+    MAX_TRADES = 10_000
+    
     def __init__(self):
         self._session = SessionMetrics()
-        self._trades: list[TradeMetrics] = []
-        self._execution_times: list[float] = []
-        self._holding_times: list[float] = []
+        self._trades: deque[TradeMetrics] = deque(maxlen=self.MAX_TRADES)
+        self._execution_time_total: float = 0
+        self._execution_count: int = 0
+        self._holding_time_total: float = 0
+        self._holding_count: int = 0
     
     def record_signal(self) -> None:
         """Record a signal detection."""
@@ -85,8 +94,7 @@ class MetricsCollector:
         self._session.total_volume += entry_cost
         self._session.total_expected_pnl += expected_pnl
         
-        self._execution_times.append(execution_time_ms)
-        self._update_avg_execution_time()
+        self._update_avg_execution_time(execution_time_ms)
         
         trade = TradeMetrics(
             execution_id=execution_id,
@@ -131,8 +139,7 @@ class MetricsCollector:
         if drawdown > self._session.max_drawdown:
             self._session.max_drawdown = drawdown
         
-        self._holding_times.append(holding_time_seconds)
-        self._update_avg_holding_time()
+        self._update_avg_holding_time(holding_time_seconds)
         
         # Update trade record
         for trade in reversed(self._trades):
@@ -150,19 +157,21 @@ class MetricsCollector:
         """Record an API error."""
         self._session.api_errors += 1
     
-    def _update_avg_execution_time(self) -> None:
+    def _update_avg_execution_time(self, execution_time_ms: float) -> None:
         """Update average execution time."""
-        if self._execution_times:
-            self._session.avg_execution_time_ms = (
-                sum(self._execution_times) / len(self._execution_times)
-            )
+        self._execution_time_total += execution_time_ms
+        self._execution_count += 1
+        self._session.avg_execution_time_ms = (
+            self._execution_time_total / self._execution_count
+        )
     
-    def _update_avg_holding_time(self) -> None:
+    def _update_avg_holding_time(self, holding_time_seconds: float) -> None:
         """Update average holding time."""
-        if self._holding_times:
-            self._session.avg_holding_time_seconds = (
-                sum(self._holding_times) / len(self._holding_times)
-            )
+        self._holding_time_total += holding_time_seconds
+        self._holding_count += 1
+        self._session.avg_holding_time_seconds = (
+            self._holding_time_total / self._holding_count
+        )
     
     def get_session_metrics(self) -> dict:
         """Get current session metrics as dict."""
@@ -191,7 +200,7 @@ class MetricsCollector:
     
     def get_recent_trades(self, limit: int = 10) -> list[dict]:
         """Get recent trades."""
-        recent = self._trades[-limit:] if self._trades else []
+        recent = reversed(list(islice(reversed(self._trades), limit)))
         return [
             {
                 "execution_id": t.execution_id,
@@ -209,6 +218,8 @@ class MetricsCollector:
     def reset_session(self) -> None:
         """Reset session metrics."""
         self._session = SessionMetrics()
-        self._trades = []
-        self._execution_times = []
-        self._holding_times = []
+        self._trades.clear()
+        self._execution_time_total = 0
+        self._execution_count = 0
+        self._holding_time_total = 0
+        self._holding_count = 0
@@ -5,13 +5,18 @@ Maintains synchronized YES/NO books for parity arbitrage detection.
 
 import threading
 import time
+from array import array
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Optional
-from sortedcontainers import SortedDict
 
+from ..units import to_micros
 
-@dataclass
+NO_PRICE = -1  # Slot array value when a side has no price
+
+
+@dataclass(slots=True)
 class PriceLevel:
     """Single price level with size."""
     price: Decimal
@@ -24,79 +29,93 @@ class PriceLevel:
             self.size = Decimal(self.size)
 
 
-@dataclass
+@dataclass(slots=True)
 class BookSide:
-    """One side of an orderbook (bids or asks)."""
+    """
+    One side of an orderbook (bids or asks).
+    
+    Sizes live in a plain dict; a sorted list of keys gives the order.
+    Keys sort ascending with the best price first: asks by price, bids by
+    negated price. Books are shallow, so bisect on a list beats a tree.
+    """
     is_bid: bool
-    levels: SortedDict = field(default_factory=SortedDict)
+    levels: dict[Decimal, Decimal] = field(default_factory=dict)
+    _keys: list[Decimal] = field(default_factory=list, repr=False)
     
-    def __post_init__(self):
-        # Bids sorted descending (highest first), asks ascending (lowest first)
-        if self.is_bid:
-            self.levels = SortedDict(lambda x: -x)
-        else:
-            self.levels = SortedDict()
+    def _key(self, price: Decimal) -> Decimal:
+        return -price if self.is_bid else price
     
     def update(self, price: Decimal, size: Decimal) -> None:
         """Update a price level. Size of 0 removes the level."""
+        key = -price if self.is_bid else price
+        levels = self.levels
         if size <= 0:
-            self.levels.pop(price, None)
+            if levels.pop(key, None) is not None:
+                keys = self._keys
+                del keys[bisect_left(keys, key)]
         else:
-            self.levels[price] = size
+            if key not in levels:
+                insort(self._keys, key)
+            levels[key] = size
     
     def set_snapshot(self, levels: list[tuple[Decimal, Decimal]]) -> None:
         """Replace all levels with a snapshot."""
-        self.levels.clear()
-        for price, size in levels:
-            if size > 0:
-                self.levels[price] = size
+        is_bid = self.is_bid
+        self.levels = {
+            -price if is_bid else price: size
+            for price, size in levels
+            if size > 0
+        }
+        self._keys = sorted(self.levels)
     
     @property
     def best(self) -> Optional[PriceLevel]:
         """Get best price level."""
-        if not self.levels:
+        if not self._keys:
             return None
-        price = self.levels.keys()[0]
-        return PriceLevel(price, self.levels[price])
+        key = self._keys[0]
+        return PriceLevel(self._key(key), self.levels[key])
     
     @property
     def best_price(self) -> Optional[Decimal]:
         """Get best price."""
-        if not self.levels:
+        if not self._keys:
             return None
-        return self.levels.keys()[0]
+        return self._key(self._keys[0])
     
     @property
     def best_size(self) -> Optional[Decimal]:
         """Get size at best price."""
-        if not self.levels:
+        if not self._keys:
             return None
-        return self.levels[self.levels.keys()[0]]
+        return self.levels[self._keys[0]]
+    
+    def size_at(self, price: Decimal) -> Optional[Decimal]:
+        """Get size resting at an exact price."""
+        return self.levels.get(self._key(price))
     
     def get_depth(self, max_levels: int = 10) -> list[PriceLevel]:
         """Get top N price levels."""
-        result = []
-        for i, price in enumerate(self.levels.keys()):
-            if i >= max_levels:
-                break
-            result.append(PriceLevel(price, self.levels[price]))
-        return result
+        levels = self.levels
+        return [
+            PriceLevel(self._key(key), levels[key])
+            for key in self._keys[:max_levels]
+        ]
     
     def get_liquidity_at_price(self, target_price: Decimal) -> Decimal:
         """Get total liquidity available at or better than target price."""
+        # Keys are ordered best-first on both sides, so one comparison works
+        target_key = self._key(target_price)
+        levels = self.levels
         total = Decimal("0")
-        for price in self.levels.keys():
-            if self.is_bid:
-                if price < target_price:
-                    break
-            else:
-                if price > target_price:
-                    break
-            total += self.levels[price]
+        for key in self._keys:
+            if key > target_key:
+                break
+            total += levels[key]
         return total
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBook:
     """Orderbook for a single token (YES or NO)."""
     token_id: str
@@ -104,13 +123,38 @@ class TokenBook:
     asks: BookSide = field(default_factory=lambda: BookSide(is_bid=False))
     last_update: float = 0
     hash: str = ""
+    # Top-of-book from best_bid_ask messages; takes precedence over the levels
+    _best_bid: Optional[Decimal] = field(default=None, init=False, repr=False)
+    _best_ask: Optional[Decimal] = field(default=None, init=False, repr=False)
     
     def update_level(self, side: str, price: Decimal, size: Decimal) -> None:
-        """Update a single price level."""
+        """
+        Update a single price level.
+        The side's levels become authoritative again, so its cached top is dropped.
+        """
         if side.upper() == "BUY":
             self.bids.update(price, size)
+            self._best_bid = None
         else:
             self.asks.update(price, size)
+            self._best_ask = None
+        self.last_update = time.time()
+    
+    def apply_batch(self, updates: list[tuple[str, Decimal, Decimal]]) -> None:
+        """
+        Apply (side, price, size) level updates from one message.
+        Timestamped once at the end rather than per level; like update_level,
+        drops the cached top of each side it touches.
+        """
+        bids = self.bids
+        asks = self.asks
+        for side, price, size in updates:
+            if side.upper() == "BUY":
+                bids.update(price, size)
+                self._best_bid = None
+            else:
+                asks.update(price, size)
+                self._best_ask = None
         self.last_update = time.time()
     
     def set_snapshot(
@@ -122,17 +166,39 @@ class TokenBook:
         """Set full book snapshot."""
         self.bids.set_snapshot(bids)
         self.asks.set_snapshot(asks)
+        self._best_bid = None
+        self._best_ask = None
         self.hash = book_hash
         self.last_update = time.time()
     
+    def set_top_of_book(self, bid: Optional[Decimal], ask: Optional[Decimal]) -> None:
+        """
+        Overwrite best bid/ask without touching the price levels.
+        None leaves that side to the levels until the next snapshot.
+        """
+        self._best_bid = bid
+        self._best_ask = ask
+        self.last_update = time.time()
+    
     @property
     def best_bid(self) -> Optional[Decimal]:
+        if self._best_bid is not None:
+            return self._best_bid
         return self.bids.best_price
     
     @property
     def best_ask(self) -> Optional[Decimal]:
+        if self._best_ask is not None:
+            return self._best_ask
         return self.asks.best_price
     
+    @property
+    def best_ask_size(self) -> Optional[Decimal]:
+        """Size resting at the best ask, None if the levels don't know it."""
+        if self._best_ask is not None:
+            return self.asks.size_at(self._best_ask)
+        return self.asks.best_size
+    
     @property
     def spread(self) -> Optional[Decimal]:
         if self.best_bid is None or self.best_ask is None:
@@ -153,7 +219,7 @@ class TokenBook:
         return time.time() - self.last_update
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketBook:
     """
     Combined YES/NO orderbook for a binary market.
@@ -166,6 +232,14 @@ class MarketBook:
     no_book: TokenBook = field(default_factory=lambda: TokenBook(""))
     tick_size: Decimal = Decimal("0.01")
     neg_risk: bool = False
+    slot: int = -1  # Index into OrderBookManager slot arrays
+    
+    # Best asks and their sizes in micro-units, NO_PRICE if unknown.
+    # Mirrored by OrderBookManager on every write.
+    yes_ask_micros: int = field(default=NO_PRICE, init=False)
+    no_ask_micros: int = field(default=NO_PRICE, init=False)
+    yes_ask_size_micros: int = field(default=NO_PRICE, init=False)
+    no_ask_size_micros: int = field(default=NO_PRICE, init=False)
     
     def __post_init__(self):
         self.yes_book = TokenBook(self.yes_token_id)
@@ -204,14 +278,23 @@ class MarketBook:
         Get the maximum size that can be executed on both sides.
         Limited by the smaller of YES ask size and NO ask size.
         """
-        yes_size = self.yes_book.asks.best_size
-        no_size = self.no_book.asks.best_size
+        yes_size = self.yes_book.best_ask_size
+        no_size = self.no_book.best_ask_size
         
         if yes_size is None or no_size is None:
             return None
         
         return min(yes_size, no_size)
     
+    @property
+    def executable_size_micros(self) -> int:
+        """get_executable_size() in micro-units, NO_PRICE if unknown."""
+        yes_size = self.yes_ask_size_micros
+        no_size = self.no_ask_size_micros
+        if yes_size == NO_PRICE or no_size == NO_PRICE:
+            return NO_PRICE
+        return yes_size if yes_size < no_size else no_size
+    
     @property
     def is_stale(self) -> bool:
         """Check if either book is stale (>60 seconds old)."""
@@ -233,6 +316,56 @@ class OrderBookManager:
         self._markets: dict[str, MarketBook] = {}
         self._token_to_market: dict[str, str] = {}  # token_id -> condition_id
         self._lock = threading.RLock()
+        
+        # Struct-of-arrays view of top of book, indexed by MarketBook.slot.
+        # Best asks, ask sizes and best bids in micro-units (NO_PRICE if unknown);
+        # read-only for callers.
+        self.slot_markets: list[Optional[MarketBook]] = []
+        self._free_slots: list[int] = []
+        self._dirty_slots: set[int] = set()  # Slots written since take_dirty_slots()
+        self.yes_ask_micros = array("q")
+        self.no_ask_micros = array("q")
+        self.yes_ask_size_micros = array("q")
+        self.no_ask_size_micros = array("q")
+        self.yes_bid_micros = array("q")
+        self.no_bid_micros = array("q")
+    
+    def _sync_slot(
+        self,
+        market: MarketBook,
+        is_yes: bool,
+        bid: bool = True,
+        ask: bool = True,
+    ) -> None:
+        """
+        Mirror one side's top of book into the market's int fields and the slot arrays.
+        Only the bid and/or ask that changed are converted.
+        """
+        book = market.yes_book if is_yes else market.no_book
+        slot = market.slot
+        self._dirty_slots.add(slot)
+        if ask:
+            price = book.best_ask
+            ask_micros = NO_PRICE if price is None else to_micros(price)
+            size = book.best_ask_size
+            size_micros = NO_PRICE if size is None else to_micros(size)
+            if is_yes:
+                market.yes_ask_micros = ask_micros
+                market.yes_ask_size_micros = size_micros
+                self.yes_ask_micros[slot] = ask_micros
+                self.yes_ask_size_micros[slot] = size_micros
+            else:
+                market.no_ask_micros = ask_micros
+                market.no_ask_size_micros = size_micros
+                self.no_ask_micros[slot] = ask_micros
+                self.no_ask_size_micros[slot] = size_micros
+        if bid:
+            price = book.best_bid
+            bid_micros = NO_PRICE if price is None else to_micros(price)
+            if is_yes:
+                self.yes_bid_micros[slot] = bid_micros
+            else:
+                self.no_bid_micros[slot] = bid_micros
     
     def add_market(
         self,
@@ -244,13 +377,31 @@ class OrderBookManager:
     ) -> MarketBook:
         """Add a market to track."""
         with self._lock:
+            if condition_id in self._markets:
+                self.remove_market(condition_id)
+            
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = len(self.slot_markets)
+                self.slot_markets.append(None)
+                self.yes_ask_micros.append(NO_PRICE)
+                self.no_ask_micros.append(NO_PRICE)
+                self.yes_ask_size_micros.append(NO_PRICE)
+                self.no_ask_size_micros.append(NO_PRICE)
+                self.yes_bid_micros.append(NO_PRICE)
+                self.no_bid_micros.append(NO_PRICE)
+            
             market = MarketBook(
                 condition_id=condition_id,
                 yes_token_id=yes_token_id,
                 no_token_id=no_token_id,
                 tick_size=Decimal(tick_size),
                 neg_risk=neg_risk,
+                slot=slot,
             )
+            self.slot_markets[slot] = market
+            self._dirty_slots.add(slot)
             self._markets[condition_id] = market
             self._token_to_market[yes_token_id] = condition_id
             self._token_to_market[no_token_id] = condition_id
@@ -284,8 +435,10 @@ class OrderBookManager:
             
             if token_id == market.yes_token_id:
                 market.yes_book.set_snapshot(bids, asks, book_hash)
+                self._sync_slot(market, True)
             elif token_id == market.no_token_id:
                 market.no_book.set_snapshot(bids, asks, book_hash)
+                self._sync_slot(market, False)
     
     def update_price_level(
         self,
@@ -300,10 +453,38 @@ class OrderBookManager:
             if not market:
                 return
             
+            is_bid = side.upper() == "BUY"
             if token_id == market.yes_token_id:
                 market.yes_book.update_level(side, price, size)
+                self._sync_slot(market, True, bid=is_bid, ask=not is_bid)
             elif token_id == market.no_token_id:
                 market.no_book.update_level(side, price, size)
+                self._sync_slot(market, False, bid=is_bid, ask=not is_bid)
+    
+    def update_levels_batch(
+        self,
+        token_id: str,
+        updates: list[tuple[str, Decimal, Decimal]],
+    ) -> None:
+        """Apply a batch of (side, price, size) level updates for one token."""
+        with self._lock:
+            condition_id = self._token_to_market.get(token_id)
+            if condition_id is None:
+                return
+            market = self._markets[condition_id]
+            
+            has_bid = has_ask = False
+            for side, _, _ in updates:
+                if side.upper() == "BUY":
+                    has_bid = True
+                else:
+                    has_ask = True
+            if token_id == market.yes_token_id:
+                market.yes_book.apply_batch(updates)
+                self._sync_slot(market, True, bid=has_bid, ask=has_ask)
+            elif token_id == market.no_token_id:
+                market.no_book.apply_batch(updates)
+                self._sync_slot(market, False, bid=has_bid, ask=has_ask)
     
     def update_best_bid_ask(
         self,
@@ -313,34 +494,33 @@ class OrderBookManager:
     ) -> None:
         """
         Update best bid/ask from WebSocket message.
-        This is a lightweight update that only touches top of book.
+        This is a lightweight update that only touches top of book;
+        sizes are still read from the price levels.
         """
         with self._lock:
-            market = self.get_market_by_token(token_id)
-            if not market:
-                return
-            
-            if token_id == market.yes_token_id:
-                book = market.yes_book
-            elif token_id == market.no_token_id:
-                book = market.no_book
-            else:
+            condition_id = self._token_to_market.get(token_id)
+            if condition_id is None:
                 return
+            market = self._markets[condition_id]
             
-            # Update best levels if they changed
-            if best_bid > 0:
-                current_best = book.bids.best_price
-                if current_best is None or current_best != best_bid:
-                    # We don't know the size, so use a placeholder
-                    # Full book update will correct this
-                    book.bids.update(best_bid, Decimal("1"))
-            
-            if best_ask > 0:
-                current_best = book.asks.best_price
-                if current_best is None or current_best != best_ask:
-                    book.asks.update(best_ask, Decimal("1"))
+            is_yes = token_id == market.yes_token_id
+            book = market.yes_book if is_yes else market.no_book
             
-            book.last_update = time.time()
+            book.set_top_of_book(
+                best_bid if best_bid > 0 else None,
+                best_ask if best_ask > 0 else None,
+            )
+            self._sync_slot(market, is_yes)
+    
+    def take_dirty_slots(self) -> set[int]:
+        """
+        Return the slots whose arrays changed since the last call, and reset.
+        Meant for a single incremental scanner (the parity detector).
+        """
+        with self._lock:
+            dirty = self._dirty_slots
+            self._dirty_slots = set()
+            return dirty
     
     def get_all_markets(self) -> list[MarketBook]:
         """Get all tracked markets."""
@@ -359,3 +539,14 @@ class OrderBookManager:
             if market:
                 self._token_to_market.pop(market.yes_token_id, None)
                 self._token_to_market.pop(market.no_token_id, None)
+                
+                slot = market.slot
+                self.slot_markets[slot] = None
+                self.yes_ask_micros[slot] = NO_PRICE
+                self.no_ask_micros[slot] = NO_PRICE
+                self.yes_ask_size_micros[slot] = NO_PRICE
+                self.no_ask_size_micros[slot] = NO_PRICE
+                self.yes_bid_micros[slot] = NO_PRICE
+                self.no_bid_micros[slot] = NO_PRICE
+                self._free_slots.append(slot)
+                self._dirty_slots.add(slot)
@@ -7,10 +7,13 @@ import time
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 from typing import TYPE_CHECKING
 
+from ..storage.database import PositionStatus as StoredPositionStatus, StoredPosition
+from ..units import SCALE, from_micros, to_micros
+
 if TYPE_CHECKING:
     from ..exec import ExecutionResult
 
@@ -23,13 +26,22 @@ class PositionStatus(Enum):
     RESOLVED = "resolved"  # Market resolved, position settled
 
 
-@dataclass
+def _parse_micros(value: Union[int, str, None]) -> Optional[int]:
+    """Read a stored amount: micro-unit int, legacy decimal string, or None."""
+    if isinstance(value, str):
+        return to_micros(Decimal(value)) if value else None
+    return value
+
+
+@dataclass(slots=True)
 class PairedPosition:
     """
     A paired YES+NO position from parity arbitrage.
     
     Entry: Buy YES at yes_entry_price, Buy NO at no_entry_price
     Exit: Either sell both sides or wait for market resolution
+    
+    Sizes, prices and USDC amounts are integer micro-units (see units.py).
     """
     position_id: str
     condition_id: str
@@ -37,41 +49,41 @@ class PairedPosition:
     no_token_id: str
     
     # Entry details
-    size: Decimal
-    yes_entry_price: Decimal
-    no_entry_price: Decimal
-    entry_cost: Decimal  # Total USDC spent
+    size: int
+    yes_entry_price: int
+    no_entry_price: int
+    entry_cost: int  # Total USDC spent
     entry_time: float
     
     # Exit details
-    yes_exit_price: Optional[Decimal] = None
-    no_exit_price: Optional[Decimal] = None
-    exit_proceeds: Optional[Decimal] = None
+    yes_exit_price: Optional[int] = None
+    no_exit_price: Optional[int] = None
+    exit_proceeds: Optional[int] = None
     exit_time: Optional[float] = None
     
     # Status
     status: PositionStatus = PositionStatus.OPEN
     
     # P&L tracking
-    realized_pnl: Decimal = Decimal("0")
+    realized_pnl: int = 0
     
     # Metadata
     execution_id: Optional[str] = None
     notes: str = ""
     
     @property
-    def combined_entry_price(self) -> Decimal:
+    def combined_entry_price(self) -> int:
         """Total price paid per share (YES + NO)."""
         return self.yes_entry_price + self.no_entry_price
     
     @property
-    def expected_pnl_at_resolution(self) -> Decimal:
+    def expected_pnl_at_resolution(self) -> int:
         """
         Expected P&L if held to resolution.
         At resolution, one side pays $1, other pays $0.
         Total payout = $1 per share.
         """
-        return (Decimal("1") - self.combined_entry_price) * self.size
+        return (SCALE - self.combined_entry_price) * self.size // SCALE
     
     @property
     def holding_time_seconds(self) -> float:
@@ -81,18 +93,18 @@ class PairedPosition:
     
     def calculate_exit_pnl(
         self,
-        yes_exit_price: Decimal,
-        no_exit_price: Decimal,
-    ) -> Decimal:
+        yes_exit_price: int,
+        no_exit_price: int,
+    ) -> int:
         """Calculate P&L for exiting at given prices."""
-        exit_proceeds = (yes_exit_price + no_exit_price) * self.size
+        exit_proceeds = (yes_exit_price + no_exit_price) * self.size // SCALE
         return exit_proceeds - self.entry_cost
     
     def close(
         self,
-        yes_exit_price: Decimal,
-        no_exit_price: Decimal,
-        exit_proceeds: Decimal,
+        yes_exit_price: int,
+        no_exit_price: int,
+        exit_proceeds: int,
     ) -> None:
         """Mark position as closed with exit details."""
         self.yes_exit_price = yes_exit_price
@@ -102,7 +114,7 @@ class PairedPosition:
         self.realized_pnl = exit_proceeds - self.entry_cost
         self.status = PositionStatus.CLOSED
     
-    def resolve(self, payout: Decimal) -> None:
+    def resolve(self, payout: int) -> None:
         """Mark position as resolved (market settled)."""
         self.exit_proceeds = payout
         self.exit_time = time.time()
@@ -110,46 +122,53 @@ class PairedPosition:
         self.status = PositionStatus.RESOLVED
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for storage."""
+        """
+        Convert to dictionary for storage.
+        Amounts are emitted as integer micro-units, so the dict is plain
+        JSON primitives.
+        """
         return {
             "position_id": self.position_id,
             "condition_id": self.condition_id,
             "yes_token_id": self.yes_token_id,
             "no_token_id": self.no_token_id,
-            "size": str(self.size),
-            "yes_entry_price": str(self.yes_entry_price),
-            "no_entry_price": str(self.no_entry_price),
-            "entry_cost": str(self.entry_cost),
+            "size": self.size,
+            "yes_entry_price": self.yes_entry_price,
+            "no_entry_price": self.no_entry_price,
+            "entry_cost": self.entry_cost,
             "entry_time": self.entry_time,
-            "yes_exit_price": str(self.yes_exit_price) if self.yes_exit_price else None,
-            "no_exit_price": str(self.no_exit_price) if self.no_exit_price else None,
-            "exit_proceeds": str(self.exit_proceeds) if self.exit_proceeds else None,
+            "yes_exit_price": self.yes_exit_price,
+            "no_exit_price": self.no_exit_price,
+            "exit_proceeds": self.exit_proceeds,
             "exit_time": self.exit_time,
             "status": self.status.value,
-            "realized_pnl": str(self.realized_pnl),
+            "realized_pnl": self.realized_pnl,
             "execution_id": self.execution_id,
             "notes": self.notes,
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> "PairedPosition":
-        """Create from dictionary."""
+        """
+        Create from dictionary.
+        Accepts integer micro-units or legacy decimal strings.
+        """
         return cls(
             position_id=data["position_id"],
             condition_id=data["condition_id"],
             yes_token_id=data["yes_token_id"],
             no_token_id=data["no_token_id"],
-            size=Decimal(data["size"]),
-            yes_entry_price=Decimal(data["yes_entry_price"]),
-            no_entry_price=Decimal(data["no_entry_price"]),
-            entry_cost=Decimal(data["entry_cost"]),
+            size=_parse_micros(data["size"]),
+            yes_entry_price=_parse_micros(data["yes_entry_price"]),
+            no_entry_price=_parse_micros(data["no_entry_price"]),
+            entry_cost=_parse_micros(data["entry_cost"]),
             entry_time=data["entry_time"],
-            yes_exit_price=Decimal(data["yes_exit_price"]) if data.get("yes_exit_price") else None,
-            no_exit_price=Decimal(data["no_exit_price"]) if data.get("no_exit_price") else None,
-            exit_proceeds=Decimal(data["exit_proceeds"]) if data.get("exit_proceeds") else None,
+            yes_exit_price=_parse_micros(data.get("yes_exit_price")),
+            no_exit_price=_parse_micros(data.get("no_exit_price")),
+            exit_proceeds=_parse_micros(data.get("exit_proceeds")),
             exit_time=data.get("exit_time"),
             status=PositionStatus(data["status"]),
-            realized_pnl=Decimal(data.get("realized_pnl", "0")),
+            realized_pnl=_parse_micros(data.get("realized_pnl", 0)),
             execution_id=data.get("execution_id"),
             notes=data.get("notes", ""),
         )
@@ -162,13 +181,58 @@ class PairedPosition:
             condition_id=result.condition_id,
             yes_token_id=result.yes_leg.token_id,
             no_token_id=result.no_leg.token_id,
-            size=result.actual_filled_size,
-            yes_entry_price=result.yes_leg.price,
-            no_entry_price=result.no_leg.price,
-            entry_cost=result.entry_cost,
+            size=to_micros(result.actual_filled_size),
+            yes_entry_price=to_micros(result.yes_leg.price),
+            no_entry_price=to_micros(result.no_leg.price),
+            entry_cost=to_micros(result.entry_cost),
             entry_time=result.created_at,
             execution_id=result.execution_id,
         )
+    
+    @classmethod
+    def from_stored(cls, stored: StoredPosition) -> "PairedPosition":
+        """Create position from a database record."""
+        return cls(
+            position_id=stored.position_id,
+            condition_id=stored.condition_id,
+            yes_token_id=stored.yes_token_id,
+            no_token_id=stored.no_token_id,
+            size=stored.size,
+            yes_entry_price=stored.yes_entry_price,
+            no_entry_price=stored.no_entry_price,
+            entry_cost=stored.entry_cost,
+            entry_time=stored.entry_time,
+            yes_exit_price=stored.yes_exit_price,
+            no_exit_price=stored.no_exit_price,
+            exit_proceeds=stored.exit_proceeds,
+            exit_time=stored.exit_time,
+            status=PositionStatus(stored.status.value),
+            realized_pnl=stored.realized_pnl,
+            execution_id=stored.execution_id,
+            notes=stored.notes,
+        )
+    
+    def to_stored(self) -> StoredPosition:
+        """Convert to a database record."""
+        return StoredPosition(
+            position_id=self.position_id,
+            condition_id=self.condition_id,
+            yes_token_id=self.yes_token_id,
+            no_token_id=self.no_token_id,
+            size=self.size,
+            yes_entry_price=self.yes_entry_price,
+            no_entry_price=self.no_entry_price,
+            entry_cost=self.entry_cost,
+            entry_time=self.entry_time,
+            yes_exit_price=self.yes_exit_price,
+            no_exit_price=self.no_exit_price,
+            exit_proceeds=self.exit_proceeds,
+            exit_time=self.exit_time,
+            status=StoredPositionStatus(self.status.value),
+            realized_pnl=self.realized_pnl,
+            execution_id=self.execution_id,
+            notes=self.notes,
+        )
 
 
 class PositionManager:
@@ -180,20 +244,49 @@ class PositionManager:
     - Calculate aggregate exposure
     - Manage position limits
     - Track P&L
+    
+    Aggregates are maintained incrementally, so status changes must go
+    through close_position/resolve_position rather than the position.
     """
     
     def __init__(self, max_open_pairs: int = 5):
         self.max_open_pairs = max_open_pairs
         self._positions: dict[str, PairedPosition] = {}
-        self._positions_by_market: dict[str, list[str]] = {}  # condition_id -> position_ids
+        # Dicts used as ordered sets, so listings keep insertion order
+        self._positions_by_market: dict[str, dict[str, None]] = {}  # condition_id -> position_ids
+        self._positions_by_status: dict[PositionStatus, dict[str, None]] = {
+            status: {} for status in PositionStatus
+        }
+        
+        # Running aggregates (micro-USDC)
+        self._total_open_exposure: int = 0
+        self._total_expected_pnl: int = 0
+        self._total_realized_pnl: int = 0
+    
+    def _track(self, position: PairedPosition, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a position from the status index and aggregates."""
+        status_ids = self._positions_by_status[position.status]
+        if sign > 0:
+            status_ids[position.position_id] = None
+        else:
+            status_ids.pop(position.position_id, None)
+        
+        # Enum members are singletons; identity skips Enum.__eq__
+        if position.status is PositionStatus.OPEN:
+            self._total_open_exposure += sign * position.entry_cost
+            self._total_expected_pnl += sign * position.expected_pnl_at_resolution
+        else:
+            self._total_realized_pnl += sign * position.realized_pnl
     
     def add_position(self, position: PairedPosition) -> None:
         """Add a new position."""
+        if position.position_id in self._positions:
+            self.remove_position(position.position_id)
+        
         self._positions[position.position_id] = position
+        self._track(position, 1)
         
-        if position.condition_id not in self._positions_by_market:
-            self._positions_by_market[position.condition_id] = []
-        self._positions_by_market[position.condition_id].append(position.position_id)
+        self._positions_by_market.setdefault(position.condition_id, {})[position.position_id] = None
     
     def get_position(self, position_id: str) -> Optional[PairedPosition]:
         """Get position by ID."""
@@ -201,12 +294,16 @@ class PositionManager:
     
     def get_positions_for_market(self, condition_id: str) -> list[PairedPosition]:
         """Get all positions for a market."""
-        position_ids = self._positions_by_market.get(condition_id, [])
-        return [self._positions[pid] for pid in position_ids if pid in self._positions]
+        # add_position/remove_position keep this index in step with _positions
+        return [self._positions[pid] for pid in self._positions_by_market.get(condition_id, ())]
     
     def get_open_positions(self) -> list[PairedPosition]:
         """Get all open positions."""
-        return [p for p in self._positions.values() if p.status == PositionStatus.OPEN]
+        return [self._positions[pid] for pid in self._positions_by_status[PositionStatus.OPEN]]
+    
+    def get_positions_by_status(self, status: PositionStatus) -> list[PairedPosition]:
+        """Get all positions with the given status."""
+        return [self._positions[pid] for pid in self._positions_by_status[status]]
     
     def get_all_positions(self) -> list[PairedPosition]:
         """Get all positions."""
@@ -215,7 +312,7 @@ class PositionManager:
     @property
     def open_position_count(self) -> int:
         """Number of open positions."""
-        return len(self.get_open_positions())
+        return len(self._positions_by_status[PositionStatus.OPEN])
     
     @property
     def can_open_new_position(self) -> bool:
@@ -223,65 +320,74 @@ class PositionManager:
         return self.open_position_count < self.max_open_pairs
     
     @property
-    def total_exposure(self) -> Decimal:
-        """Total USDC exposure across all open positions."""
-        return sum(p.entry_cost for p in self.get_open_positions())
+    def total_exposure(self) -> int:
+        """Total USDC exposure across all open positions (micro-USDC)."""
+        return self._total_open_exposure
     
     @property
-    def total_expected_pnl(self) -> Decimal:
-        """Total expected P&L if all positions held to resolution."""
-        return sum(p.expected_pnl_at_resolution for p in self.get_open_positions())
+    def total_expected_pnl(self) -> int:
+        """Total expected P&L if all positions held to resolution (micro-USDC)."""
+        return self._total_expected_pnl
     
     @property
-    def total_realized_pnl(self) -> Decimal:
-        """Total realized P&L from closed positions."""
-        return sum(p.realized_pnl for p in self._positions.values() if p.status != PositionStatus.OPEN)
+    def total_realized_pnl(self) -> int:
+        """Total realized P&L from closed positions (micro-USDC)."""
+        return self._total_realized_pnl
     
     def close_position(
         self,
         position_id: str,
-        yes_exit_price: Decimal,
-        no_exit_price: Decimal,
-        exit_proceeds: Decimal,
+        yes_exit_price: int,
+        no_exit_price: int,
+        exit_proceeds: int,
     ) -> Optional[PairedPosition]:
         """Close a position with exit details."""
         position = self._positions.get(position_id)
         if position:
+            self._track(position, -1)
             position.close(yes_exit_price, no_exit_price, exit_proceeds)
+            self._track(position, 1)
         return position
     
-    def resolve_position(self, position_id: str, payout: Decimal) -> Optional[PairedPosition]:
+    def resolve_position(self, position_id: str, payout: int) -> Optional[PairedPosition]:
         """Mark position as resolved (market settled)."""
         position = self._positions.get(position_id)
         if position:
+            self._track(position, -1)
             position.resolve(payout)
+            self._track(position, 1)
         return position
     
     def remove_position(self, position_id: str) -> Optional[PairedPosition]:
         """Remove a position from tracking."""
         position = self._positions.pop(position_id, None)
         if position:
-            market_positions = self._positions_by_market.get(position.condition_id, [])
-            if position_id in market_positions:
-                market_positions.remove(position_id)
+            self._track(position, -1)
+            market_positions = self._positions_by_market.get(position.condition_id)
+            if market_positions is not None:
+                market_positions.pop(position_id, None)
         return position
     
-    def get_market_exposure(self, condition_id: str) -> Decimal:
-        """Get total exposure for a specific market."""
-        positions = self.get_positions_for_market(condition_id)
-        return sum(p.entry_cost for p in positions if p.status == PositionStatus.OPEN)
+    def get_market_exposure(self, condition_id: str) -> int:
+        """Get total exposure for a specific market (micro-USDC)."""
+        open_ids = self._positions_by_status[PositionStatus.OPEN]
+        return sum(
+            self._positions[pid].entry_cost
+            for pid in self._positions_by_market.get(condition_id, ())
+            if pid in open_ids
+        )
     
     def get_summary(self) -> dict:
         """Get summary statistics."""
-        open_positions = self.get_open_positions()
-        closed_positions = [p for p in self._positions.values() if p.status != PositionStatus.OPEN]
+        # Reads the incremental aggregates; no pass over the positions
+        open_count = len(self._positions_by_status[PositionStatus.OPEN])
         
         return {
-            "open_count": len(open_positions),
-            "closed_count": len(closed_positions),
-            "total_exposure": str(self.total_exposure),
-            "total_expected_pnl": str(self.total_expected_pnl),
-            "total_realized_pnl": str(self.total_realized_pnl),
+            "open_count": open_count,
+            "closed_count": len(self._positions) - open_count,
+            "total_exposure": str(from_micros(self._total_open_exposure)),
+            "total_expected_pnl": str(from_micros(self._total_expected_pnl)),
+            "total_realized_pnl": str(from_micros(self._total_realized_pnl)),
             "markets_with_positions": list(self._positions_by_market.keys()),
         }
     
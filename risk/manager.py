@@ -5,13 +5,17 @@ Handles limits, cooldowns, kill-switch, and health checks.
 
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 
 from typing import TYPE_CHECKING
 
+from ..positions import PositionStatus
+from ..units import SCALE, from_micros, to_micros
+
 if TYPE_CHECKING:
     from ..config import RiskConfig, TradingConfig
     from ..positions import PositionManager
@@ -30,31 +34,102 @@ class RiskViolation(Enum):
     CONNECTION_LOST = "connection_lost"
 
 
-@dataclass
+# Result codes from _evaluate_risk
+_RISK_OK = 0
+_RISK_KILL_SWITCH = 1
+_RISK_COOLDOWN = 2
+_RISK_MAX_OPEN_PAIRS = 3
+_RISK_MAX_DAILY_LOSS = 4
+_RISK_MAX_POSITION_VALUE = 5
+_RISK_CONSECUTIVE_FAILURES = 6
+
+
+def _evaluate_risk(
+    kill_switch_active: bool,
+    last_trade_ms: int,
+    now_ms: int,
+    cooldown_ms: int,
+    open_count: int,
+    max_open: int,
+    daily_pnl: int,
+    max_daily_loss: int,
+    exposure: int,
+    max_exposure: int,
+    consecutive_failures: int,
+    max_failures: int,
+) -> int:
+    """
+    Pure scalar core of RiskManager.check_can_trade.
+    Amounts are micro-USDC, times are monotonic milliseconds.
+    Returns _RISK_OK or the first violated code.
+    """
+    # Cheapest checks first so rejection-heavy periods exit early
+    if kill_switch_active:
+        return _RISK_KILL_SWITCH
+    if consecutive_failures >= max_failures:
+        return _RISK_CONSECUTIVE_FAILURES
+    if last_trade_ms != 0 and now_ms - last_trade_ms < cooldown_ms:
+        return _RISK_COOLDOWN
+    if open_count >= max_open:
+        return _RISK_MAX_OPEN_PAIRS
+    if daily_pnl < -max_daily_loss:
+        return _RISK_MAX_DAILY_LOSS
+    if exposure >= max_exposure:
+        return _RISK_MAX_POSITION_VALUE
+    return _RISK_OK
+
+
+@dataclass(frozen=True, slots=True)
 class RiskCheck:
-    """Result of a risk check."""
+    """
+    Result of a risk check.
+    The message may be built lazily; it is only formatted when read.
+    """
     passed: bool
     violation: Optional[RiskViolation] = None
-    message: str = ""
+    _message: str = field(default="", repr=False)
+    _message_builder: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def message(self) -> str:
+        if self._message_builder is not None:
+            object.__setattr__(self, "_message", self._message_builder())
+            object.__setattr__(self, "_message_builder", None)
+        return self._message
     
     @classmethod
     def ok(cls) -> "RiskCheck":
-        return cls(passed=True)
+        # Passing checks carry no state, so every caller shares one instance
+        return _RISK_CHECK_OK
     
     @classmethod
-    def fail(cls, violation: RiskViolation, message: str = "") -> "RiskCheck":
-        return cls(passed=False, violation=violation, message=message)
+    def fail(
+        cls,
+        violation: RiskViolation,
+        message: Union[str, Callable[[], str]] = "",
+    ) -> "RiskCheck":
+        if callable(message):
+            return cls(passed=False, violation=violation, _message_builder=message)
+        return cls(passed=False, violation=violation, _message=message)
+
+
+_RISK_CHECK_OK = RiskCheck(passed=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
-    """Daily trading statistics."""
-    date: str  # YYYY-MM-DD
+    """Daily trading statistics. Amounts are micro-USDC."""
+    day_ord: int  # UTC days since the epoch
     trades_count: int = 0
-    total_volume: Decimal = Decimal("0")
-    realized_pnl: Decimal = Decimal("0")
-    max_drawdown: Decimal = Decimal("0")
-    peak_pnl: Decimal = Decimal("0")
+    total_volume: int = 0
+    realized_pnl: int = 0
+    max_drawdown: int = 0
+    peak_pnl: int = 0
+    
+    @property
+    def date(self) -> str:
+        """Day as YYYY-MM-DD (UTC), for display."""
+        return time.strftime("%Y-%m-%d", time.gmtime(self.day_ord * 86400))
 
 
 class RiskManager:
@@ -81,10 +156,17 @@ class RiskManager:
         self.positions = position_manager
         self.logger = logger
         
+        # Limits in micro-USDC, converted once so checks are int compares
+        self._max_daily_loss: int = 0
+        self._max_position_value: int = 0
+        self._kill_switch_loss_threshold: int = 0
+        self._max_notional_per_trade: int = 0
+        self.refresh_limits()
+        
         # State
         self._kill_switch_active = False
         self._kill_switch_reason: Optional[str] = None
-        self._last_trade_time: float = 0
+        self._last_trade_time_ms: int = 0  # time.monotonic_ns() // 1_000_000, 0 if none
         self._consecutive_failures: int = 0
         self._daily_stats: Optional[DailyStats] = None
         
@@ -93,8 +175,19 @@ class RiskManager:
         self._ws_connected: bool = False
         self._last_ws_message: float = 0
         
-        # Callbacks
+        # Callbacks; run off the risk-check path so slow handlers can't stall it
         self._on_kill_switch: list[Callable[[str], None]] = []
+        self._kill_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="killswitch")
+    
+    def refresh_limits(self) -> None:
+        """
+        Re-read loss and exposure limits from the configs.
+        Call after changing config values at runtime.
+        """
+        self._max_daily_loss = to_micros(self.config.max_daily_loss)
+        self._max_position_value = to_micros(self.config.max_position_value)
+        self._kill_switch_loss_threshold = to_micros(self.config.kill_switch_loss_threshold)
+        self._max_notional_per_trade = to_micros(self.trading.max_notional_per_trade)
     
     def on_kill_switch(self, callback: Callable[[str], None]) -> None:
         """Register callback for kill switch activation."""
@@ -109,10 +202,19 @@ class RiskManager:
             self.logger.critical("kill_switch_triggered", reason=reason)
         
         for callback in self._on_kill_switch:
-            try:
-                callback(reason)
-            except Exception:
-                pass
+            self._kill_executor.submit(self._run_kill_switch_callback, callback, reason)
+    
+    def _run_kill_switch_callback(self, callback: Callable[[str], None], reason: str) -> None:
+        """Run one kill switch callback on the executor, logging failures."""
+        try:
+            callback(reason)
+        except Exception as e:
+            if self.logger:
+                self.logger.error("kill_switch_callback_error", error=str(e))
+    
+    def shutdown(self) -> None:
+        """Wait for pending kill switch callbacks and release the executor."""
+        self._kill_executor.shutdown(wait=True)
     
     def reset_kill_switch(self) -> None:
         """Reset kill switch (manual intervention required)."""
@@ -131,95 +233,117 @@ class RiskManager:
         Comprehensive check if trading is allowed.
         Returns RiskCheck with pass/fail and reason.
         """
-        # Kill switch check
-        if self._kill_switch_active:
+        # Hot path: read PositionManager's running totals directly rather
+        # than through its properties
+        pm = self.positions
+        stats = self._daily_stats
+        code = _evaluate_risk(
+            self._kill_switch_active,
+            self._last_trade_time_ms,
+            time.monotonic_ns() // 1_000_000,
+            self.trading.cooldown_ms,
+            len(pm._positions_by_status[PositionStatus.OPEN]),
+            pm.max_open_pairs,
+            stats.realized_pnl if stats is not None else self._get_daily_pnl(),
+            self._max_daily_loss,
+            pm._total_open_exposure,
+            self._max_position_value,
+            self._consecutive_failures,
+            self.config.max_consecutive_failures,
+        )
+        if code == _RISK_OK:
+            return RiskCheck.ok()
+        return self._risk_check_failure(code)
+    
+    def _risk_check_failure(self, code: int) -> RiskCheck:
+        """Build the failed RiskCheck for an _evaluate_risk code."""
+        if code == _RISK_KILL_SWITCH:
             return RiskCheck.fail(
                 RiskViolation.KILL_SWITCH_TRIGGERED,
-                f"Kill switch active: {self._kill_switch_reason}"
+                lambda reason=self._kill_switch_reason: f"Kill switch active: {reason}"
             )
         
-        # Cooldown check
-        if not self._check_cooldown():
-            remaining = self._cooldown_remaining_ms()
+        if code == _RISK_COOLDOWN:
             return RiskCheck.fail(
                 RiskViolation.COOLDOWN_ACTIVE,
-                f"Cooldown active: {remaining}ms remaining"
+                lambda remaining=self._cooldown_remaining_ms(): (
+                    f"Cooldown active: {remaining}ms remaining"
+                )
             )
         
-        # Position limit check
-        if not self.positions.can_open_new_position:
+        if code == _RISK_MAX_OPEN_PAIRS:
             return RiskCheck.fail(
                 RiskViolation.MAX_OPEN_PAIRS,
-                f"Max open pairs reached: {self.positions.open_position_count}"
+                lambda count=self.positions.open_position_count: (
+                    f"Max open pairs reached: {count}"
+                )
             )
         
-        # Daily loss check
-        daily_pnl = self._get_daily_pnl()
-        if daily_pnl < -Decimal(str(self.config.max_daily_loss)):
+        if code == _RISK_MAX_DAILY_LOSS:
+            daily_pnl = from_micros(self._get_daily_pnl())
             self._trigger_kill_switch(f"Daily loss limit exceeded: {daily_pnl}")
             return RiskCheck.fail(
                 RiskViolation.MAX_DAILY_LOSS,
                 f"Daily loss limit exceeded: {daily_pnl}"
             )
         
-        # Position value check
-        total_exposure = self.positions.total_exposure
-        if total_exposure >= Decimal(str(self.config.max_position_value)):
+        if code == _RISK_MAX_POSITION_VALUE:
             return RiskCheck.fail(
                 RiskViolation.MAX_POSITION_VALUE,
-                f"Max position value reached: {total_exposure}"
+                lambda exposure=self.positions.total_exposure: (
+                    f"Max position value reached: {from_micros(exposure)}"
+                )
             )
         
-        # Consecutive failures check
-        if self._consecutive_failures >= self.config.max_consecutive_failures:
-            return RiskCheck.fail(
-                RiskViolation.CONSECUTIVE_FAILURES,
-                f"Too many consecutive failures: {self._consecutive_failures}"
+        return RiskCheck.fail(
+            RiskViolation.CONSECUTIVE_FAILURES,
+            lambda failures=self._consecutive_failures: (
+                f"Too many consecutive failures: {failures}"
             )
-        
-        return RiskCheck.ok()
+        )
     
     def check_trade_size(self, size: Decimal, price: Decimal) -> RiskCheck:
         """Check if a specific trade size is allowed."""
-        notional = size * price
-        max_notional = Decimal(str(self.trading.max_notional_per_trade))
+        notional = to_micros(size) * to_micros(price) // SCALE
         
-        if notional > max_notional:
+        if notional > self._max_notional_per_trade:
             return RiskCheck.fail(
                 RiskViolation.MAX_POSITION_VALUE,
-                f"Trade notional {notional} exceeds max {max_notional}"
+                lambda notional=notional, max_notional=self._max_notional_per_trade: (
+                    f"Trade notional {from_micros(notional)} exceeds max "
+                    f"{from_micros(max_notional)}"
+                )
             )
         
         # Check if this would exceed total position limit
         new_total = self.positions.total_exposure + notional
-        if new_total > Decimal(str(self.config.max_position_value)):
+        if new_total > self._max_position_value:
             return RiskCheck.fail(
                 RiskViolation.MAX_POSITION_VALUE,
-                f"Trade would exceed max position value"
+                "Trade would exceed max position value"
             )
         
         return RiskCheck.ok()
     
     def _check_cooldown(self) -> bool:
         """Check if cooldown period has passed."""
-        if self._last_trade_time == 0:
+        if self._last_trade_time_ms == 0:
             return True
         
-        elapsed_ms = (time.time() - self._last_trade_time) * 1000
+        elapsed_ms = time.monotonic_ns() // 1_000_000 - self._last_trade_time_ms
         return elapsed_ms >= self.trading.cooldown_ms
     
     def _cooldown_remaining_ms(self) -> int:
         """Get remaining cooldown time in milliseconds."""
-        if self._last_trade_time == 0:
+        if self._last_trade_time_ms == 0:
             return 0
         
-        elapsed_ms = (time.time() - self._last_trade_time) * 1000
-        remaining = self.trading.cooldown_ms - elapsed_ms
-        return max(0, int(remaining))
+        elapsed_ms = time.monotonic_ns() // 1_000_000 - self._last_trade_time_ms
+        return max(0, self.trading.cooldown_ms - elapsed_ms)
     
-    def record_trade(self, success: bool, pnl: Decimal = Decimal("0")) -> None:
-        """Record a trade attempt."""
-        self._last_trade_time = time.time()
+    def record_trade(self, success: bool, pnl: int = 0) -> None:
+        """Record a trade attempt. pnl is micro-USDC."""
+        self._last_trade_time_ms = time.monotonic_ns() // 1_000_000
         
         if success:
             self._consecutive_failures = 0
@@ -232,31 +356,29 @@ class RiskManager:
                     f"Consecutive failures: {self._consecutive_failures}"
                 )
     
-    def record_pnl(self, pnl: Decimal) -> None:
-        """Record realized P&L."""
+    def record_pnl(self, pnl: int) -> None:
+        """Record realized P&L in micro-USDC."""
         self._update_daily_stats(pnl)
         
         # Check for kill switch threshold
         daily_pnl = self._get_daily_pnl()
-        if daily_pnl < -Decimal(str(self.config.kill_switch_loss_threshold)):
-            self._trigger_kill_switch(f"Loss threshold exceeded: {daily_pnl}")
+        if daily_pnl < -self._kill_switch_loss_threshold:
+            self._trigger_kill_switch(f"Loss threshold exceeded: {from_micros(daily_pnl)}")
     
-    def _get_daily_pnl(self) -> Decimal:
-        """Get today's realized P&L."""
+    def _get_daily_pnl(self) -> int:
+        """Get today's realized P&L in micro-USDC."""
         if self._daily_stats is None:
             self._init_daily_stats()
         return self._daily_stats.realized_pnl
     
     def _init_daily_stats(self) -> None:
-        """Initialize daily stats for today."""
-        today = time.strftime("%Y-%m-%d")
-        self._daily_stats = DailyStats(date=today)
+        """Initialize daily stats for today (UTC)."""
+        self._daily_stats = DailyStats(day_ord=int(time.time()) // 86400)
     
-    def _update_daily_stats(self, pnl: Decimal) -> None:
+    def _update_daily_stats(self, pnl: int) -> None:
         """Update daily statistics."""
-        today = time.strftime("%Y-%m-%d")
-        
-        if self._daily_stats is None or self._daily_stats.date != today:
+        # Integer day compare; the date string is only formatted for display
+        if self._daily_stats is None or int(time.time()) // 86400 != self._daily_stats.day_ord:
             self._init_daily_stats()
         
         self._daily_stats.trades_count += 1
@@ -307,8 +429,8 @@ class RiskManager:
         
         # Check daily P&L
         daily_pnl = self._get_daily_pnl()
-        if daily_pnl < Decimal("0"):
-            issues.append(f"Daily P&L negative: {daily_pnl}")
+        if daily_pnl < 0:
+            issues.append(f"Daily P&L negative: {from_micros(daily_pnl)}")
         
         return {
             "healthy": len(issues) == 0,
@@ -316,15 +438,20 @@ class RiskManager:
             "ws_connected": self._ws_connected,
             "kill_switch_active": self._kill_switch_active,
             "consecutive_failures": self._consecutive_failures,
-            "daily_pnl": str(daily_pnl),
+            "daily_pnl": str(from_micros(daily_pnl)),
             "open_positions": self.positions.open_position_count,
-            "total_exposure": str(self.positions.total_exposure),
+            "total_exposure": str(from_micros(self.positions.total_exposure)),
             "timestamp": self._last_health_check,
         }
     
     async def health_check_loop(self, interval: Optional[int] = None) -> None:
-        """Run periodic health checks."""
+        """
+        Run periodic health checks.
+        Wakeups are scheduled against the monotonic clock so check time
+        does not accumulate into drift. Cancel the task to stop.
+        """
         interval = interval or self.config.health_check_interval_seconds
+        next_deadline = time.monotonic() + interval
         
         while True:
             try:
@@ -333,25 +460,44 @@ class RiskManager:
                 if not health["healthy"] and self.logger:
                     self.logger.warning("health_check_issues", issues=health["issues"])
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 if self.logger:
                     self.logger.error("health_check_error", error=str(e))
             
-            await asyncio.sleep(interval)
+            now = time.monotonic()
+            if next_deadline < now:
+                # Overran a whole period; resync rather than firing back-to-back
+                next_deadline = now
+            await asyncio.sleep(next_deadline - now)
+            next_deadline += interval
     
     def get_status(self) -> dict:
         """Get current risk manager status."""
+        stats = self._daily_stats
+        if stats is None:
+            daily_stats = {
+                "date": None,
+                "trades_count": 0,
+                "realized_pnl": "0",
+                "max_drawdown": "0",
+            }
+        else:
+            daily_stats = {
+                "date": stats.date,
+                "trades_count": stats.trades_count,
+                "realized_pnl": str(from_micros(stats.realized_pnl)),
+                "max_drawdown": str(from_micros(stats.max_drawdown)),
+            }
+        
+        positions = self.positions
         return {
             "kill_switch_active": self._kill_switch_active,
             "kill_switch_reason": self._kill_switch_reason,
             "consecutive_failures": self._consecutive_failures,
             "cooldown_remaining_ms": self._cooldown_remaining_ms(),
-            "daily_stats": {
-                "date": self._daily_stats.date if self._daily_stats else None,
-                "trades_count": self._daily_stats.trades_count if self._daily_stats else 0,
-                "realized_pnl": str(self._daily_stats.realized_pnl) if self._daily_stats else "0",
-                "max_drawdown": str(self._daily_stats.max_drawdown) if self._daily_stats else "0",
-            },
-            "position_count": self.positions.open_position_count,
-            "total_exposure": str(self.positions.total_exposure),
+            "daily_stats": daily_stats,
+            "position_count": positions.open_position_count,
+            "total_exposure": str(from_micros(positions.total_exposure)),
         }
@@ -3,17 +3,22 @@ Parity arbitrage signal detector.
 Identifies opportunities where YES_ask + NO_ask < 1 - fees - slippage.
 """
 
+import heapq
 import time
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Callable, Optional, TYPE_CHECKING
+from itertools import count
+from typing import Callable, Iterable, Optional, Sequence, TYPE_CHECKING
+
+from ..orderbook.book import NO_PRICE
+from ..units import SCALE, from_micros, to_micros
 
 if TYPE_CHECKING:
     from ..config import FeeConfig, TradingConfig
     from ..orderbook import MarketBook, OrderBookManager
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParitySignal:
     """
     Parity arbitrage opportunity signal.
@@ -29,13 +34,18 @@ class ParitySignal:
     gross_edge: Decimal  # 1 - combined_cost
     net_edge: Decimal  # gross_edge - fees - slippage
     max_size: Decimal  # Maximum executable size
-    timestamp: float
+    timestamp_ns: int  # time.monotonic_ns() at detection
     
     @property
     def is_profitable(self) -> bool:
         """Check if signal is profitable after costs."""
         return self.net_edge > 0
     
+    @property
+    def timestamp(self) -> float:
+        """Wall-clock epoch seconds of timestamp_ns, mapped through the current clock offset."""
+        return time.time() - (time.monotonic_ns() - self.timestamp_ns) / 1e9
+    
     @property
     def expected_profit_per_share(self) -> Decimal:
         """Expected profit per share at resolution."""
@@ -46,6 +56,74 @@ class ParitySignal:
         return self.net_edge * size
 
 
+def _scan_parity(
+    yes_asks: Sequence[int],
+    no_asks: Sequence[int],
+    yes_sizes: Sequence[int],
+    no_sizes: Sequence[int],
+    fee_rate: int,
+    slippage: int,
+    max_notional: int,
+    min_edge: int,
+    slots: Optional[Iterable[int]] = None,
+) -> list[tuple[int, int, int, int, int]]:
+    """
+    Parity kernel over parallel slot arrays, all values in micro-units.
+    Returns (net_edge, slot, combined_cost, gross_edge, max_size) for every
+    slot (or only the given slots) whose net edge is at least min_edge.
+    Pure int math and locals only; markets that fail the edge test never
+    hit a division.
+    """
+    if slots is None:
+        rows = zip(count(), yes_asks, no_asks, yes_sizes, no_sizes)
+    else:
+        rows = (
+            (slot, yes_asks[slot], no_asks[slot], yes_sizes[slot], no_sizes[slot])
+            for slot in slots
+        )
+    
+    max_notional_scaled = max_notional * SCALE
+    min_edge_scaled = min_edge * SCALE
+    candidates = []
+    for slot, yes_ask, no_ask, yes_size, no_size in rows:
+        if yes_ask == NO_PRICE or no_ask == NO_PRICE:
+            continue
+        
+        combined_cost = yes_ask + no_ask
+        gross_edge = SCALE - combined_cost
+        if gross_edge <= 0:
+            continue
+        
+        net_edge = gross_edge - slippage
+        if fee_rate:
+            # Test the edge with the fee left at SCALE^2 so misses skip the division
+            yes_fee_factor = yes_ask if yes_ask < SCALE - yes_ask else SCALE - yes_ask
+            no_fee_factor = no_ask if no_ask < SCALE - no_ask else SCALE - no_ask
+            fee_scaled = fee_rate * (yes_fee_factor + no_fee_factor)
+            if net_edge * SCALE - fee_scaled < min_edge_scaled:
+                continue
+            net_edge -= -(-fee_scaled // SCALE)  # Fee rounded up
+        elif net_edge < min_edge:
+            continue
+        
+        # Unknown sizes are NO_PRICE, so they fall out here too
+        max_size = yes_size if yes_size < no_size else no_size
+        max_size_by_notional = max_notional_scaled // combined_cost
+        if max_size_by_notional < max_size:
+            max_size = max_size_by_notional
+        if max_size <= 0:
+            continue
+        
+        candidates.append((net_edge, slot, combined_cost, gross_edge, max_size))
+    
+    return candidates
+
+
+def _candidate_rank(item: tuple) -> tuple:
+    """Sort key for (candidate, market) pairs: net edge, then slot."""
+    return item[0][:2]
+
+
 class ParityDetector:
     """
     Detects parity arbitrage opportunities across markets.
@@ -55,6 +133,10 @@ class ParityDetector:
     we lock in a guaranteed profit of (1 - ask_yes - ask_no) per share.
     """
     
+    # get_last_signal() stops returning a signal this old; matches the
+    # 60 second MarketBook.is_stale cutoff
+    SIGNAL_TTL_NS = 60_000_000_000
+    
     def __init__(
         self,
         orderbook_manager: "OrderBookManager",
@@ -65,21 +147,64 @@ class ParityDetector:
         self.fees = fee_config
         self.trading = trading_config
         
-        self._callbacks: list[Callable[[ParitySignal], None]] = []
+        # Tuples, replaced on register, so emitters iterate a stable snapshot
+        self._callbacks: tuple[Callable[[ParitySignal], None], ...] = ()
+        self._batch_callbacks: tuple[Callable[[list[ParitySignal]], None], ...] = ()
         self._last_signals: dict[str, ParitySignal] = {}
+        
+        # Kernel results by slot, refreshed only for slots the orderbook
+        # marks dirty; a full sweep rebuilds them after config changes
+        self._candidates: dict[int, tuple[int, int, int, int, int]] = {}
+        self._needs_full_scan = True
+        
+        self.refresh_config()
+    
+    def refresh_config(self) -> None:
+        """
+        Re-read fee and trading limits from the configs.
+        Kept in micro-units so the scan path is integer-only; call after
+        changing config values at runtime.
+        """
+        self._taker_fee_rate = to_micros(self.fees.taker_fee_rate)
+        self._max_notional = to_micros(self.trading.max_notional_per_trade)
+        self._slippage = to_micros(self.trading.slippage_buffer)
+        self._min_edge = to_micros(self.trading.min_edge)
+        self._needs_full_scan = True
     
     def on_signal(self, callback: Callable[[ParitySignal], None]) -> None:
         """Register callback for new signals."""
-        self._callbacks.append(callback)
+        self._callbacks += (callback,)
+    
+    def on_signal_batch(self, callback: Callable[[list[ParitySignal]], None]) -> None:
+        """Register callback for the sorted signal list of each full scan."""
+        self._batch_callbacks += (callback,)
     
     def _emit_signal(self, signal: ParitySignal) -> None:
         """Emit signal to all registered callbacks."""
-        for callback in self._callbacks:
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(signal)
             except Exception:
                 pass  # Don't let callback errors break detection
     
+    def _emit_batch(self, signals: list[ParitySignal]) -> None:
+        """Emit a scan's signals: each to per-signal callbacks, then the list to batch callbacks."""
+        if not signals:
+            return
+        
+        if self._callbacks:
+            for signal in signals:
+                self._emit_signal(signal)
+        
+        for callback in self._batch_callbacks:
+            try:
+                callback(signals)
+            except Exception:
+                pass
+    
     def calculate_fees(self, yes_price: Decimal, no_price: Decimal, size: Decimal) -> Decimal:
         """
         Calculate total fees for buying both sides.
@@ -89,109 +214,218 @@ class ParityDetector:
         
         For most markets, fees are 0. For 15-min crypto markets, taker fees apply.
         """
-        if self.fees.taker_fee_rate == 0:
+        if self._taker_fee_rate == 0:
             return Decimal("0")
         
-        # Fee for YES side
-        yes_fee_factor = min(yes_price, Decimal("1") - yes_price)
-        yes_fee = self.fees.taker_fee_rate * yes_fee_factor * size
-        
-        # Fee for NO side
-        no_fee_factor = min(no_price, Decimal("1") - no_price)
-        no_fee = self.fees.taker_fee_rate * no_fee_factor * size
-        
-        return Decimal(str(yes_fee + no_fee))
+        fee_per_share = self._fee_per_share(to_micros(yes_price), to_micros(no_price))
+        return from_micros(fee_per_share * to_micros(size) // SCALE)
     
-    def check_market(self, market: "MarketBook") -> Optional[ParitySignal]:
+    def _fee_per_share(self, yes_price: int, no_price: int) -> int:
+        """Taker fee per share for buying both sides, in micro-units rounded up."""
+        yes_fee_factor = yes_price if yes_price < SCALE - yes_price else SCALE - yes_price
+        no_fee_factor = no_price if no_price < SCALE - no_price else SCALE - no_price
+        return -(-self._taker_fee_rate * (yes_fee_factor + no_fee_factor) // SCALE)
+    
+    def _evaluate(self, market: "MarketBook") -> Optional[tuple[int, int, int, int]]:
         """
-        Check a single market for parity arbitrage opportunity.
-        
-        Returns signal if profitable opportunity exists, None otherwise.
+        Integer core of check_market.
+        Returns (combined_cost, gross_edge, net_edge, max_size) in micro-units,
+        or None if the market cannot be traded.
         """
         # Skip stale books
         if market.is_stale:
             return None
         
-        yes_ask = market.yes_best_ask
-        no_ask = market.no_best_ask
-        
-        if yes_ask is None or no_ask is None:
+        yes_ask = market.yes_ask_micros
+        no_ask = market.no_ask_micros
+        if yes_ask == NO_PRICE or no_ask == NO_PRICE:
             return None
         
-        # Combined cost to buy both sides
-        combined_cost = yes_ask + no_ask
-        
         # Gross edge before fees and slippage
-        gross_edge = Decimal("1") - combined_cost
-        
-        # Skip if no gross edge
+        combined_cost = yes_ask + no_ask
+        gross_edge = SCALE - combined_cost
         if gross_edge <= 0:
             return None
         
-        # Get executable size (limited by smaller side)
-        max_size = market.get_executable_size()
-        if max_size is None or max_size <= 0:
+        # Executable size (limited by smaller side), capped by max notional
+        max_size = market.executable_size_micros
+        if max_size <= 0:
             return None
+        max_size_by_notional = self._max_notional * SCALE // combined_cost
+        if max_size_by_notional < max_size:
+            max_size = max_size_by_notional
         
-        # Cap size by max notional
-        max_notional = Decimal(str(self.trading.max_notional_per_trade))
-        max_size_by_notional = max_notional / combined_cost
-        max_size = min(max_size, max_size_by_notional)
-        
-        # Calculate fees
-        fees = self.calculate_fees(yes_ask, no_ask, max_size)
-        fee_per_share = fees / max_size if max_size > 0 else Decimal("0")
+        # Net edge after fees and slippage buffer
+        net_edge = gross_edge - self._slippage
+        if self._taker_fee_rate:
+            net_edge -= self._fee_per_share(yes_ask, no_ask)
         
-        # Apply slippage buffer
-        slippage = Decimal(str(self.trading.slippage_buffer))
-        
-        # Net edge after all costs
-        net_edge = gross_edge - fee_per_share - slippage
-        
-        signal = ParitySignal(
+        return combined_cost, gross_edge, net_edge, max_size
+    
+    def _build_signal(
+        self,
+        market: "MarketBook",
+        combined_cost: int,
+        gross_edge: int,
+        net_edge: int,
+        max_size: int,
+    ) -> ParitySignal:
+        """Materialize a ParitySignal from micro-unit results."""
+        return ParitySignal(
             condition_id=market.condition_id,
             yes_token_id=market.yes_token_id,
             no_token_id=market.no_token_id,
-            yes_ask=yes_ask,
-            no_ask=no_ask,
-            combined_cost=combined_cost,
-            gross_edge=gross_edge,
-            net_edge=net_edge,
-            max_size=max_size,
-            timestamp=time.time(),
+            yes_ask=from_micros(market.yes_ask_micros),
+            no_ask=from_micros(market.no_ask_micros),
+            combined_cost=from_micros(combined_cost),
+            gross_edge=from_micros(gross_edge),
+            net_edge=from_micros(net_edge),
+            max_size=from_micros(max_size),
+            timestamp_ns=time.monotonic_ns(),
         )
+    
+    def check_market(self, market: "MarketBook") -> Optional[ParitySignal]:
+        """
+        Check a single market for parity arbitrage opportunity.
         
-        return signal
+        Returns signal if profitable opportunity exists, None otherwise.
+        """
+        result = self._evaluate(market)
+        if result is None:
+            return None
+        return self._build_signal(market, *result)
     
-    def scan_all_markets(self) -> list[ParitySignal]:
+    def _scan_candidates(self) -> list[tuple[int, int, int, int, int]]:
         """
-        Scan all markets for parity opportunities.
-        Returns list of profitable signals sorted by edge (highest first).
+        Current _scan_parity results over the orderbook's slot arrays.
+        Only slots written since the last call are re-evaluated.
         """
-        signals = []
-        min_edge = Decimal(str(self.trading.min_edge))
+        book = self.orderbook
+        dirty = book.take_dirty_slots()
+        
+        if self._needs_full_scan:
+            self._needs_full_scan = False
+            slots = None
+            self._candidates.clear()
+        elif dirty:
+            slots = sorted(dirty)
+            for slot in slots:
+                self._candidates.pop(slot, None)
+        else:
+            return list(self._candidates.values())
+        
+        for candidate in _scan_parity(
+            book.yes_ask_micros,
+            book.no_ask_micros,
+            book.yes_ask_size_micros,
+            book.no_ask_size_micros,
+            self._taker_fee_rate,
+            self._slippage,
+            self._max_notional,
+            self._min_edge,
+            slots,
+        ):
+            self._candidates[candidate[1]] = candidate
+        
+        self._drop_lost_signals(slots)
+        return list(self._candidates.values())
+    
+    def _drop_lost_signals(self, slots: Optional[list[int]]) -> None:
+        """
+        Forget last signals for re-evaluated slots that no longer have a
+        candidate (spread collapsed); slots=None means every slot was.
+        """
+        last_signals = self._last_signals
+        if not last_signals:
+            return
+        slot_markets = self.orderbook.slot_markets
+        candidates = self._candidates
+        
+        if slots is None:
+            live = {
+                market.condition_id
+                for market in (slot_markets[slot] for slot in candidates)
+                if market is not None
+            }
+            for condition_id in [c for c in last_signals if c not in live]:
+                del last_signals[condition_id]
+            return
+        
+        for slot in slots:
+            if slot not in candidates:
+                market = slot_markets[slot]
+                if market is not None:
+                    last_signals.pop(market.condition_id, None)
+    
+    def scan_all_markets(self, top_k: Optional[int] = None) -> list[ParitySignal]:
+        """
+        Scan all markets for parity opportunities.
+        Returns list of profitable signals sorted by edge (highest first),
+        limited to the best top_k if given.
         
-        for market in self.orderbook.get_all_markets():
-            signal = self.check_market(market)
-            
-            if signal and signal.net_edge >= min_edge:
-                signals.append(signal)
-                self._last_signals[market.condition_id] = signal
-                self._emit_signal(signal)
+        Sweeps the orderbook's parallel slot arrays in one pass; signals
+        are only built for markets that clear min_edge.
+        """
+        slot_markets = self.orderbook.slot_markets
+        live = []
+        for candidate in self._scan_candidates():
+            market = slot_markets[candidate[1]]
+            if market is not None and not market.is_stale:
+                live.append((candidate, market))
+        
+        # Sort by net edge descending; partial selection when only top_k is needed
+        if top_k is None:
+            live.sort(key=_candidate_rank, reverse=True)
+        else:
+            live = heapq.nlargest(top_k, live, key=_candidate_rank)
         
-        # Sort by net edge descending
-        signals.sort(key=lambda s: s.net_edge, reverse=True)
+        signals = []
+        for (net_edge, _, combined_cost, gross_edge, max_size), market in live:
+            signal = self._build_signal(market, combined_cost, gross_edge, net_edge, max_size)
+            signals.append(signal)
+            self._last_signals[market.condition_id] = signal
         
+        self._emit_batch(signals)
         return signals
     
     def get_best_opportunity(self) -> Optional[ParitySignal]:
-        """Get the single best opportunity across all markets."""
-        signals = self.scan_all_markets()
-        return signals[0] if signals else None
+        """
+        Get the single best opportunity across all markets.
+        Single pass over the scan results: no sort, no signal list and no
+        callbacks, so it is safe to poll.
+        """
+        candidates = self._scan_candidates()
+        
+        best = None
+        best_market = None
+        slot_markets = self.orderbook.slot_markets
+        for candidate in candidates:
+            if best is not None and candidate[0] <= best[0]:
+                continue
+            market = slot_markets[candidate[1]]
+            if market is None or market.is_stale:
+                continue
+            best = candidate
+            best_market = market
+        
+        if best is None:
+            return None
+        
+        net_edge, _, combined_cost, gross_edge, max_size = best
+        signal = self._build_signal(best_market, combined_cost, gross_edge, net_edge, max_size)
+        self._last_signals[best_market.condition_id] = signal
+        return signal
     
     def get_last_signal(self, condition_id: str) -> Optional[ParitySignal]:
-        """Get the last signal for a specific market."""
-        return self._last_signals.get(condition_id)
+        """
+        Get the last signal for a specific market.
+        None once its spread has collapsed or it is older than SIGNAL_TTL_NS.
+        """
+        signal = self._last_signals.get(condition_id)
+        if signal is not None and time.monotonic_ns() - signal.timestamp_ns > self.SIGNAL_TTL_NS:
+            del self._last_signals[condition_id]
+            return None
+        return signal
     
     def clear_signals(self) -> None:
         """Clear cached signals."""
@@ -215,6 +449,9 @@ class ConvergenceDetector:
     ):
         self.orderbook = orderbook_manager
         self.threshold = convergence_threshold
+        
+        # Combined bid at or above this (micro-units) means converged
+        self._exit_bid_micros = SCALE - to_micros(convergence_threshold)
     
     def should_exit(self, condition_id: str) -> tuple[bool, str]:
         """
@@ -222,28 +459,38 @@ class ConvergenceDetector:
         
         Returns (should_exit, reason).
         """
-        market = self.orderbook.get_market(condition_id)
-        if not market:
-            return True, "market_not_found"
-        
-        yes_bid = market.yes_book.best_bid
-        no_bid = market.no_book.best_bid
-        
-        if yes_bid is None or no_bid is None:
-            return False, "no_bids"
-        
-        # Check if we can exit profitably
-        # If YES_bid + NO_bid >= 1 - threshold, spread has converged
-        combined_bid = yes_bid + no_bid
-        
-        if combined_bid >= Decimal("1") - self.threshold:
-            return True, "spread_converged"
-        
-        # Check for stale data
-        if market.is_stale:
-            return False, "stale_data"
-        
-        return False, "hold"
+        return self.batch_should_exit([condition_id])[0]
+    
+    def batch_should_exit(self, condition_ids: list[str]) -> list[tuple[bool, str]]:
+        """
+        should_exit for many markets at once.
+        Reads best bids from the orderbook's slot arrays in micro-units.
+        """
+        book = self.orderbook
+        yes_bids = book.yes_bid_micros
+        no_bids = book.no_bid_micros
+        exit_bid = self._exit_bid_micros
+        
+        results = []
+        for condition_id in condition_ids:
+            market = book.get_market(condition_id)
+            if not market:
+                results.append((True, "market_not_found"))
+                continue
+            
+            yes_bid = yes_bids[market.slot]
+            no_bid = no_bids[market.slot]
+            if yes_bid == NO_PRICE or no_bid == NO_PRICE:
+                results.append((False, "no_bids"))
+            elif yes_bid + no_bid >= exit_bid:
+                # If YES_bid + NO_bid >= 1 - threshold, spread has converged
+                results.append((True, "spread_converged"))
+            elif market.is_stale:
+                results.append((False, "stale_data"))
+            else:
+                results.append((False, "hold"))
+        
+        return results
     
     def get_exit_value(self, condition_id: str) -> Optional[Decimal]:
         """
@@ -12,24 +12,40 @@ Strategy:
 """
 
 import asyncio
+import json
 import time
+from bisect import bisect_right
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 import aiohttp
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to stdlib
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class SpotData:
-    """Current spot price data."""
+    """
+    Current spot price data.
+    Advisory only, so kept as floats; the WebSocket feed updates it in place.
+    """
     symbol: str
-    price: Decimal
-    open_price: Decimal  # Candle open
-    change_pct: Decimal  # % change from open
-    timestamp: float
+    price: float
+    open_price: float  # Candle open
+    change_pct: float  # % change from open
+    timestamp_ns: int  # time.monotonic_ns() when fetched
+    
+    @property
+    def timestamp(self) -> float:
+        """Wall-clock epoch seconds of timestamp_ns, mapped through the current clock offset."""
+        return time.time() - (time.monotonic_ns() - self.timestamp_ns) / 1e9
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpotLagSignal:
     """
     Signal when Polymarket lags spot price movement.
@@ -49,11 +65,16 @@ class SpotLagSignal:
     recommended_price: Decimal  # Price to buy at
     token_id: str  # Token to buy
     max_size: Decimal
-    timestamp: float
+    timestamp_ns: int  # time.monotonic_ns() at detection
     
     @property
     def is_profitable(self) -> bool:
         return abs(self.edge) > Decimal("0.02")  # 2% edge minimum
+    
+    @property
+    def timestamp(self) -> float:
+        """Wall-clock epoch seconds of timestamp_ns, mapped through the current clock offset."""
+        return time.time() - (time.monotonic_ns() - self.timestamp_ns) / 1e9
 
 
 class BinanceSpotFeed:
@@ -69,6 +90,8 @@ class BinanceSpotFeed:
         "sol": "SOLUSD",
     }
     
+    _SYMBOL_BY_PAIR = {pair: symbol for symbol, pair in KRAKEN_SYMBOLS.items()}
+    
     COINGECKO_IDS = {
         "btc": "bitcoin",
         "eth": "ethereum",
@@ -89,10 +112,24 @@ class BinanceSpotFeed:
         self._callbacks.append(callback)
     
     async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared keep-alive HTTP session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
         return self._session
     
+    @staticmethod
+    async def _fetch_json(session: aiohttp.ClientSession, url: str):
+        """GET a URL and decode the JSON body, releasing the connection to the pool."""
+        async with session.get(url) as resp:
+            return await resp.json(loads=_json_loads)
+    
     async def get_current_price(self, symbol: str) -> Optional[SpotData]:
         """Fetch current price via REST - tries Kraken first, then CoinGecko."""
         symbol = symbol.lower()
@@ -114,51 +151,52 @@ class BinanceSpotFeed:
         
         try:
             session = await self._get_session()
+            ticker_url = f"https://api.kraken.com/0/public/Ticker?pair={kraken_symbol}"
             
-            # Get current ticker
-            async with session.get(
-                f"https://api.kraken.com/0/public/Ticker?pair={kraken_symbol}",
-                timeout=aiohttp.ClientTimeout(total=5)
-            ) as resp:
-                data = await resp.json()
-                if data.get("error"):
-                    return None
-                
-                result = data.get("result", {})
-                ticker_data = list(result.values())[0] if result else None
-                if not ticker_data:
-                    return None
-                
-                current_price = Decimal(ticker_data["c"][0])  # Last trade price
-                open_price = Decimal(ticker_data["o"])  # Today's open
-            
-            # Get 15-min OHLC for candle open
+            # Refresh the 15-min candle open alongside the ticker when a new candle starts
             current_15min = (int(time.time()) // 900) * 900
             if symbol not in self._candle_opens or self._last_candle_time.get(symbol, 0) != current_15min:
-                async with session.get(
-                    f"https://api.kraken.com/0/public/OHLC?pair={kraken_symbol}&interval=15",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    ohlc_data = await resp.json()
-                    if not ohlc_data.get("error"):
-                        ohlc_result = ohlc_data.get("result", {})
-                        candles = list(ohlc_result.values())[0] if ohlc_result else []
-                        if candles and isinstance(candles, list) and len(candles) > 0:
-                            # Last candle open price
-                            last_candle = candles[-1]
-                            if len(last_candle) > 1:
-                                self._candle_opens[symbol] = Decimal(str(last_candle[1]))
-                                self._last_candle_time[symbol] = current_15min
+                data, ohlc_data = await asyncio.gather(
+                    self._fetch_json(session, ticker_url),
+                    self._fetch_json(
+                        session,
+                        f"https://api.kraken.com/0/public/OHLC?pair={kraken_symbol}&interval=15",
+                    ),
+                )
+            else:
+                data = await self._fetch_json(session, ticker_url)
+                ohlc_data = None
+            
+            if data.get("error"):
+                return None
+            
+            result = data.get("result", {})
+            ticker_data = list(result.values())[0] if result else None
+            if not ticker_data:
+                return None
+            
+            current_price = Decimal(ticker_data["c"][0])  # Last trade price
+            open_price = Decimal(ticker_data["o"])  # Today's open
+            
+            if ohlc_data is not None and not ohlc_data.get("error"):
+                ohlc_result = ohlc_data.get("result", {})
+                candles = list(ohlc_result.values())[0] if ohlc_result else []
+                if candles and isinstance(candles, list) and len(candles) > 0:
+                    # Last candle open price
+                    last_candle = candles[-1]
+                    if len(last_candle) > 1:
+                        self._candle_opens[symbol] = Decimal(last_candle[1])
+                        self._last_candle_time[symbol] = current_15min
             
             candle_open = self._candle_opens.get(symbol, current_price)
             change_pct = ((current_price - candle_open) / candle_open) * 100 if candle_open > 0 else Decimal("0")
             
             spot_data = SpotData(
                 symbol=symbol,
-                price=current_price,
-                open_price=candle_open,
-                change_pct=change_pct,
-                timestamp=time.time(),
+                price=float(current_price),
+                open_price=float(candle_open),
+                change_pct=float(change_pct),
+                timestamp_ns=time.monotonic_ns(),
             )
             
             self._prices[symbol] = spot_data
@@ -178,9 +216,8 @@ class BinanceSpotFeed:
             
             async with session.get(
                 f"https://api.coingecko.com/api/v3/simple/price?ids={cg_id}&vs_currencies=usd&include_24hr_change=true",
-                timeout=aiohttp.ClientTimeout(total=5)
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=_json_loads)
                 
                 if cg_id not in data:
                     return None
@@ -196,10 +233,10 @@ class BinanceSpotFeed:
                 
                 spot_data = SpotData(
                     symbol=symbol,
-                    price=current_price,
-                    open_price=candle_open,
-                    change_pct=change_pct,
-                    timestamp=time.time(),
+                    price=float(current_price),
+                    open_price=float(candle_open),
+                    change_pct=float(change_pct),
+                    timestamp_ns=time.monotonic_ns(),
                 )
                 
                 self._prices[symbol] = spot_data
@@ -226,43 +263,51 @@ class BinanceSpotFeed:
                         }
                         await ws.send_json(subscribe_msg)
                         
+                        symbol_by_pair = self._SYMBOL_BY_PAIR
+                        text_type = aiohttp.WSMsgType.TEXT
+                        
                         async for msg in ws:
-                            if msg.type == aiohttp.WSMsgType.TEXT:
-                                data = msg.json()
-                                if isinstance(data, list) and len(data) >= 4:
-                                    await self._handle_kraken_ticker(data)
+                            # Ticker frames are JSON arrays; heartbeats and
+                            # events are objects and are dropped undecoded
+                            if msg.type is not text_type or not msg.data.startswith("["):
+                                continue
+                            
+                            data = _json_loads(msg.data)
+                            if type(data) is list and len(data) >= 4:
+                                symbol = symbol_by_pair.get(data[3])
+                                if symbol is not None:
+                                    self._handle_kraken_ticker(symbol, data[1])
             except Exception:
                 if self._running:
                     await asyncio.sleep(5)
     
-    async def _handle_kraken_ticker(self, data: list) -> None:
-        """Handle ticker update from Kraken WS."""
+    def _handle_kraken_ticker(self, symbol: str, ticker_data: dict) -> None:
+        """Handle ticker update from Kraken WS for an already-resolved symbol."""
         try:
-            ticker_data = data[1]
-            pair = data[3]
-            
-            symbol_map = {v: k for k, v in self.KRAKEN_SYMBOLS.items()}
-            symbol = symbol_map.get(pair)
-            if not symbol:
-                return
-            
-            current_price = Decimal(ticker_data["c"][0])
-            open_price = Decimal(ticker_data["o"][0]) if "o" in ticker_data else current_price
+            current_price = float(ticker_data["c"][0])
+            open_price = float(ticker_data["o"][0]) if "o" in ticker_data else current_price
             
             if open_price > 0:
-                change_pct = ((current_price - open_price) / open_price) * 100
+                change_pct = (current_price - open_price) / open_price * 100.0
             else:
-                change_pct = Decimal("0")
+                change_pct = 0.0
             
-            spot_data = SpotData(
-                symbol=symbol,
-                price=current_price,
-                open_price=open_price,
-                change_pct=change_pct,
-                timestamp=time.time(),
-            )
-            
-            self._prices[symbol] = spot_data
+            # Update the cached entry in place rather than allocating per tick
+            spot_data = self._prices.get(symbol)
+            if spot_data is None:
+                spot_data = SpotData(
+                    symbol=symbol,
+                    price=current_price,
+                    open_price=open_price,
+                    change_pct=change_pct,
+                    timestamp_ns=time.monotonic_ns(),
+                )
+                self._prices[symbol] = spot_data
+            else:
+                spot_data.price = current_price
+                spot_data.open_price = open_price
+                spot_data.change_pct = change_pct
+                spot_data.timestamp_ns = time.monotonic_ns()
             
             for callback in self._callbacks:
                 try:
@@ -283,6 +328,13 @@ class BinanceSpotFeed:
             await self._session.close()
 
 
+def _mid(bid: Decimal, ask: Decimal) -> Decimal:
+    """Mid price for implied probability; the ask alone if either side is empty."""
+    if bid > 0 and ask < 1:
+        return (bid + ask) / 2
+    return ask
+
+
 class SpotLagDetector:
     """
     Detects spot-lag opportunities.
@@ -312,6 +364,12 @@ class SpotLagDetector:
         (2.0, 100.0): Decimal("0.40"),
     }
     
+    # SPOT_MOVE_TO_PROB flattened for bisect: _MOVE_BIN_EDGES[i] is the upper
+    # bound of bin i, and moves past the last bound get no adjustment.
+    _MOVE_BIN_EDGES = tuple(max_move for _, max_move in SPOT_MOVE_TO_PROB)
+    _MOVE_BIN_UP = tuple(float(adjustment) for adjustment in SPOT_MOVE_TO_PROB.values()) + (0.0,)
+    _MOVE_BIN_DOWN = tuple(-adjustment for adjustment in _MOVE_BIN_UP)
+    
     def __init__(
         self,
         spot_feed: BinanceSpotFeed,
@@ -322,13 +380,28 @@ class SpotLagDetector:
         self.min_edge = min_edge
         self.min_spot_move = min_spot_move
         
+        # Probability math is advisory, so it runs in float
+        self._min_edge_f = float(min_edge)
+        self._min_spot_move_f = float(min_spot_move)
+        
         self._market_tokens: dict[str, dict] = {}  # symbol -> {condition_id, up_token, down_token}
         self._pm_prices: dict[str, tuple[Decimal, Decimal]] = {}  # symbol -> (up_price, down_price)
-        self._callbacks: list[Callable[[SpotLagSignal], None]] = []
+        self._callbacks: tuple[Callable[[SpotLagSignal], None], ...] = ()
     
     def on_signal(self, callback: Callable[[SpotLagSignal], None]) -> None:
         """Register callback for signals."""
-        self._callbacks.append(callback)
+        self._callbacks += (callback,)
+    
+    def _emit_signal(self, signal: SpotLagSignal) -> None:
+        """Emit signal to all registered callbacks."""
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
+            try:
+                callback(signal)
+            except Exception:
+                pass
     
     def register_market(
         self,
@@ -353,25 +426,25 @@ class SpotLagDetector:
         down_ask: Decimal,
     ) -> None:
         """Update Polymarket prices for a symbol."""
-        # Use mid prices for implied probability
-        up_mid = (up_bid + up_ask) / 2 if up_bid > 0 and up_ask < 1 else up_ask
-        down_mid = (down_bid + down_ask) / 2 if down_bid > 0 and down_ask < 1 else down_ask
-        
-        self._pm_prices[symbol.lower()] = (up_mid, down_mid)
+        self._pm_prices[symbol.lower()] = (_mid(up_bid, up_ask), _mid(down_bid, down_ask))
+    
+    def update_pm_prices_batch(
+        self,
+        updates: Iterable[tuple[str, Decimal, Decimal, Decimal, Decimal]],
+    ) -> None:
+        """Update Polymarket prices from (symbol, up_bid, up_ask, down_bid, down_ask) rows."""
+        pm_prices = self._pm_prices
+        for symbol, up_bid, up_ask, down_bid, down_ask in updates:
+            pm_prices[symbol.lower()] = (_mid(up_bid, up_ask), _mid(down_bid, down_ask))
     
-    def _get_fair_prob_adjustment(self, spot_change_pct: Decimal) -> Decimal:
+    def _get_fair_prob_adjustment(self, spot_change_pct: float) -> float:
         """
         Get fair probability adjustment based on spot move.
         Positive spot move -> positive adjustment to UP probability.
         """
-        abs_move = abs(spot_change_pct)
-        sign = Decimal("1") if spot_change_pct >= 0 else Decimal("-1")
-        
-        for (min_move, max_move), adjustment in self.SPOT_MOVE_TO_PROB.items():
-            if Decimal(str(min_move)) <= abs_move < Decimal(str(max_move)):
-                return adjustment * sign
-        
-        return Decimal("0")
+        if spot_change_pct >= 0:
+            return self._MOVE_BIN_UP[bisect_right(self._MOVE_BIN_EDGES, spot_change_pct)]
+        return self._MOVE_BIN_DOWN[bisect_right(self._MOVE_BIN_EDGES, -spot_change_pct)]
     
     def check_opportunity(self, symbol: str) -> Optional[SpotLagSignal]:
         """
@@ -385,7 +458,8 @@ class SpotLagDetector:
             return None
         
         # Check minimum spot move
-        if abs(spot_data.change_pct) < self.min_spot_move:
+        change_pct = spot_data.change_pct
+        if abs(change_pct) < self._min_spot_move_f:
             return None
         
         # Get PM prices
@@ -402,59 +476,49 @@ class SpotLagDetector:
         
         # Calculate implied probability (from PM prices)
         # In a binary market, UP price ≈ UP probability
-        implied_up_prob = up_price
+        implied_up_prob = float(up_price)
         
-        # Calculate fair probability based on spot move
-        base_prob = Decimal("0.50")  # Assume 50/50 at candle open
-        prob_adjustment = self._get_fair_prob_adjustment(spot_data.change_pct)
-        fair_up_prob = base_prob + prob_adjustment
+        # Calculate fair probability based on spot move, assuming 50/50 at candle open
+        fair_up_prob = 0.5 + self._get_fair_prob_adjustment(change_pct)
         
         # Clamp to valid range
-        fair_up_prob = max(Decimal("0.05"), min(Decimal("0.95"), fair_up_prob))
+        fair_up_prob = max(0.05, min(0.95, fair_up_prob))
         
-        # Calculate edge
-        if spot_data.change_pct > 0:
+        # Calculate edge, rounded to micro precision so exact ties compare as in Decimal
+        if change_pct > 0:
             # Spot is up -> should buy UP
-            edge = fair_up_prob - implied_up_prob
+            edge = round(fair_up_prob - implied_up_prob, 6)
             direction = "UP"
             token_id = market_info["up_token"]
             recommended_price = up_price
         else:
             # Spot is down -> should buy DOWN
-            fair_down_prob = Decimal("1") - fair_up_prob
-            implied_down_prob = down_price
-            edge = fair_down_prob - implied_down_prob
+            edge = round((1.0 - fair_up_prob) - float(down_price), 6)
             direction = "DOWN"
             token_id = market_info["down_token"]
             recommended_price = down_price
         
         # Check minimum edge
-        if edge < self.min_edge:
+        if edge < self._min_edge_f:
             return None
         
         signal = SpotLagSignal(
             condition_id=market_info["condition_id"],
             symbol=symbol,
-            spot_change_pct=spot_data.change_pct,
+            spot_change_pct=Decimal(str(change_pct)),
             pm_up_price=up_price,
             pm_down_price=down_price,
-            implied_up_prob=implied_up_prob,
-            fair_up_prob=fair_up_prob,
-            edge=edge,
+            implied_up_prob=up_price,
+            fair_up_prob=Decimal(str(round(fair_up_prob, 6))),
+            edge=Decimal(str(edge)),
             direction=direction,
             recommended_price=recommended_price,
             token_id=token_id,
             max_size=Decimal("100"),  # Will be updated with actual liquidity
-            timestamp=time.time(),
+            timestamp_ns=time.monotonic_ns(),
         )
         
-        # Emit signal
-        for callback in self._callbacks:
-            try:
-                callback(signal)
-            except Exception:
-                pass
-        
+        self._emit_signal(signal)
         return signal
     
     def scan_all(self) -> list[SpotLagSignal]:
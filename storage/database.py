@@ -4,14 +4,355 @@ Stores positions, trades, P&L history, and bot state for restarts.
 """
 
 import json
-import sqlite3
+import queue
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Any, Callable, Generator, Iterable, Iterator, Optional
+
+from ..units import from_micros, to_micros
+
+try:
+    # Drop-in replacement bundling a current SQLite build, independent of the
+    # system library the interpreter was linked against
+    from pysqlite3 import dbapi2 as sqlite3
+except ImportError:  # pysqlite3 is optional; fall back to stdlib
+    import sqlite3
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to stdlib
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value).encode()
+    _json_loads = json.loads
+
+# Per-connection tuning. WAL is persistent on the file and is set once in _init_db.
+# foreign_keys stays off: trades can be logged (or queued write-behind) before
+# their position row is saved.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+    # Checkpoint every ~1000 pages and truncate the WAL back to 64MB afterwards
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA journal_size_limit=67108864",
+)
+
+# Amount columns on positions; INTEGER micro-units since schema v2
+_POSITION_AMOUNT_COLUMNS = (
+    "size", "yes_entry_price", "no_entry_price", "entry_cost",
+    "yes_exit_price", "no_exit_price", "exit_proceeds", "realized_pnl",
+)
+
+# Dictionary tables for the long hex ids; positions and trades store the
+# integer keys since schema v3
+_SQL_CREATE_MARKETS = """
+    CREATE TABLE IF NOT EXISTS markets (
+        market_int_id INTEGER PRIMARY KEY,
+        condition_id TEXT NOT NULL UNIQUE
+    )
+"""
+
+_SQL_CREATE_TOKENS = """
+    CREATE TABLE IF NOT EXISTS tokens (
+        token_int_id INTEGER PRIMARY KEY,
+        token_id TEXT NOT NULL UNIQUE
+    )
+"""
+
+_SQL_INTERN_MARKET = "INSERT OR IGNORE INTO markets (condition_id) VALUES (?)"
+_SQL_INTERN_TOKEN = "INSERT OR IGNORE INTO tokens (token_id) VALUES (?)"
+
+_SQL_CREATE_POSITIONS = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        position_id TEXT PRIMARY KEY,
+        condition_int_id INTEGER NOT NULL REFERENCES markets(market_int_id),
+        yes_token_int_id INTEGER NOT NULL REFERENCES tokens(token_int_id),
+        no_token_int_id INTEGER NOT NULL REFERENCES tokens(token_int_id),
+        size INTEGER NOT NULL,
+        yes_entry_price INTEGER NOT NULL,
+        no_entry_price INTEGER NOT NULL,
+        entry_cost INTEGER NOT NULL,
+        entry_time REAL NOT NULL,
+        yes_exit_price INTEGER,
+        no_exit_price INTEGER,
+        exit_proceeds INTEGER,
+        exit_time REAL,
+        status TEXT NOT NULL,
+        realized_pnl INTEGER DEFAULT 0,
+        execution_id TEXT,
+        notes TEXT DEFAULT '',
+        created_at REAL DEFAULT (strftime('%s', 'now')),
+        updated_at REAL DEFAULT (strftime('%s', 'now'))
+    )
+"""
+
+# Upserts update conflicting rows in place; OR REPLACE would delete and
+# re-insert them, rewriting every index entry and resetting created_at.
+# Ids are bound as text and resolved to their interned keys; see _intern_ids
+_SQL_SAVE_POSITION = """
+    INSERT INTO positions (
+        position_id, condition_int_id, yes_token_int_id, no_token_int_id,
+        size, yes_entry_price, no_entry_price, entry_cost,
+        entry_time, yes_exit_price, no_exit_price, exit_proceeds,
+        exit_time, status, realized_pnl, execution_id, notes,
+        updated_at
+    ) VALUES (
+        ?,
+        (SELECT market_int_id FROM markets WHERE condition_id = ?),
+        (SELECT token_int_id FROM tokens WHERE token_id = ?),
+        (SELECT token_int_id FROM tokens WHERE token_id = ?),
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    ON CONFLICT(position_id) DO UPDATE SET
+        condition_int_id = excluded.condition_int_id,
+        yes_token_int_id = excluded.yes_token_int_id,
+        no_token_int_id = excluded.no_token_int_id,
+        size = excluded.size,
+        yes_entry_price = excluded.yes_entry_price,
+        no_entry_price = excluded.no_entry_price,
+        entry_cost = excluded.entry_cost,
+        entry_time = excluded.entry_time,
+        yes_exit_price = excluded.yes_exit_price,
+        no_exit_price = excluded.no_exit_price,
+        exit_proceeds = excluded.exit_proceeds,
+        exit_time = excluded.exit_time,
+        status = excluded.status,
+        realized_pnl = excluded.realized_pnl,
+        execution_id = excluded.execution_id,
+        notes = excluded.notes,
+        updated_at = excluded.updated_at
+"""
+
+_SQL_CREATE_TRADES = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        trade_id TEXT PRIMARY KEY,
+        position_id TEXT,
+        execution_id TEXT,
+        token_int_id INTEGER NOT NULL REFERENCES tokens(token_int_id),
+        side TEXT NOT NULL,
+        price TEXT NOT NULL,
+        size TEXT NOT NULL,
+        fee TEXT DEFAULT '0',
+        timestamp REAL NOT NULL,
+        order_id TEXT,
+        FOREIGN KEY (position_id) REFERENCES positions(position_id)
+    )
+"""
+
+# Amount columns on daily_pnl; INTEGER micro-units since schema v2
+_DAILY_PNL_AMOUNT_COLUMNS = (
+    "total_volume", "realized_pnl", "expected_pnl", "max_drawdown", "peak_pnl",
+)
+
+_SQL_CREATE_DAILY_PNL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        date TEXT PRIMARY KEY,
+        trades_count INTEGER DEFAULT 0,
+        total_volume INTEGER DEFAULT 0,
+        realized_pnl INTEGER DEFAULT 0,
+        expected_pnl INTEGER DEFAULT 0,
+        max_drawdown INTEGER DEFAULT 0,
+        peak_pnl INTEGER DEFAULT 0,
+        updated_at REAL DEFAULT (strftime('%s', 'now'))
+    )
+"""
+
+_SQL_CREATE_BOT_STATE = """
+    CREATE TABLE IF NOT EXISTS bot_state (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        updated_at REAL DEFAULT (strftime('%s', 'now'))
+    )
+"""
+
+# Running position totals, kept current by triggers so reads are one row lookup.
+# Seeded from positions when first created.
+_SQL_CREATE_SUMMARY = (
+    """
+    CREATE TABLE IF NOT EXISTS summary (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        total_realized_pnl INTEGER NOT NULL DEFAULT 0,
+        total_volume INTEGER NOT NULL DEFAULT 0,
+        total_positions INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    INSERT OR IGNORE INTO summary (id, total_realized_pnl, total_volume, total_positions)
+    SELECT 0, COALESCE(SUM(realized_pnl), 0), COALESCE(SUM(entry_cost), 0), COUNT(*)
+    FROM positions
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS positions_summary_ai AFTER INSERT ON positions BEGIN
+        UPDATE summary SET
+            total_realized_pnl = total_realized_pnl + NEW.realized_pnl,
+            total_volume = total_volume + NEW.entry_cost,
+            total_positions = total_positions + 1
+        WHERE id = 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS positions_summary_au AFTER UPDATE ON positions BEGIN
+        UPDATE summary SET
+            total_realized_pnl = total_realized_pnl + NEW.realized_pnl - OLD.realized_pnl,
+            total_volume = total_volume + NEW.entry_cost - OLD.entry_cost
+        WHERE id = 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS positions_summary_ad AFTER DELETE ON positions BEGIN
+        UPDATE summary SET
+            total_realized_pnl = total_realized_pnl - OLD.realized_pnl,
+            total_volume = total_volume - OLD.entry_cost,
+            total_positions = total_positions - 1
+        WHERE id = 0;
+    END
+    """,
+)
+
+# Open positions are the only status queried on the hot path, so a partial
+# index over them replaces the old full idx_positions_status.
+_SQL_CREATE_INDEXES = (
+    "DROP INDEX IF EXISTS idx_positions_status",
+    "CREATE INDEX IF NOT EXISTS idx_positions_open "
+    "ON positions(entry_time DESC) WHERE status = 'open'",
+    "CREATE INDEX IF NOT EXISTS idx_positions_condition ON positions(condition_int_id)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_position ON trades(position_id)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades(timestamp DESC)",
+)
+
+# Columns in StoredPosition field order, so _row_to_position can unpack a plain
+# tuple, then updated_at for the decoded-position cache
+_SQL_SELECT_POSITIONS = """
+    SELECT p.position_id, m.condition_id, yt.token_id, nt.token_id,
+        p.size, p.yes_entry_price, p.no_entry_price, p.entry_cost,
+        p.entry_time, p.yes_exit_price, p.no_exit_price, p.exit_proceeds,
+        p.exit_time, p.status, p.realized_pnl, p.execution_id, COALESCE(p.notes, ''),
+        p.updated_at
+    FROM positions p
+    JOIN markets m ON m.market_int_id = p.condition_int_id
+    JOIN tokens yt ON yt.token_int_id = p.yes_token_int_id
+    JOIN tokens nt ON nt.token_int_id = p.no_token_int_id
+"""
+
+_SQL_GET_POSITION = _SQL_SELECT_POSITIONS + "WHERE p.position_id = ?"
+# The status literal must match idx_positions_open's WHERE for the planner to use it
+_SQL_GET_OPEN_POSITIONS = _SQL_SELECT_POSITIONS + "WHERE p.status = 'open'"
+_SQL_GET_POSITIONS_BY_MARKET = _SQL_SELECT_POSITIONS + (
+    "WHERE p.condition_int_id = (SELECT market_int_id FROM markets WHERE condition_id = ?)"
+)
+_SQL_GET_RECENT_POSITIONS = _SQL_SELECT_POSITIONS + "ORDER BY p.entry_time DESC LIMIT ?"
+
+# token_id is bound as text and resolved like _SQL_SAVE_POSITION's ids;
+# it must be interned first (_SQL_INTERN_TOKEN)
+_SQL_SAVE_TRADE = """
+    INSERT INTO trades (
+        trade_id, position_id, execution_id, token_int_id,
+        side, price, size, fee, timestamp, order_id
+    ) VALUES (
+        ?, ?, ?,
+        (SELECT token_int_id FROM tokens WHERE token_id = ?),
+        ?, ?, ?, ?, ?, ?
+    )
+    ON CONFLICT(trade_id) DO UPDATE SET
+        position_id = excluded.position_id,
+        execution_id = excluded.execution_id,
+        token_int_id = excluded.token_int_id,
+        side = excluded.side,
+        price = excluded.price,
+        size = excluded.size,
+        fee = excluded.fee,
+        timestamp = excluded.timestamp,
+        order_id = excluded.order_id
+"""
+
+# Same columns and names as the pre-v3 table, with token_id joined back
+_SQL_SELECT_TRADES = """
+    SELECT t.trade_id, t.position_id, t.execution_id, k.token_id,
+        t.side, t.price, t.size, t.fee, t.timestamp, t.order_id
+    FROM trades t
+    JOIN tokens k ON k.token_int_id = t.token_int_id
+"""
+
+_SQL_GET_TRADES_FOR_POSITION = _SQL_SELECT_TRADES + "WHERE t.position_id = ? ORDER BY t.timestamp"
+_SQL_GET_RECENT_TRADES = _SQL_SELECT_TRADES + "ORDER BY t.timestamp DESC LIMIT ?"
+
+_SQL_UPSERT_DAILY_PNL = """
+    INSERT INTO daily_pnl (
+        date, trades_count, total_volume, realized_pnl,
+        expected_pnl, max_drawdown, peak_pnl, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        trades_count = trades_count + excluded.trades_count,
+        total_volume = total_volume + excluded.total_volume,
+        realized_pnl = excluded.realized_pnl,
+        expected_pnl = excluded.expected_pnl,
+        max_drawdown = excluded.max_drawdown,
+        peak_pnl = excluded.peak_pnl,
+        updated_at = excluded.updated_at
+"""
+
+_SQL_GET_DAILY_PNL = "SELECT * FROM daily_pnl WHERE date = ?"
+_SQL_GET_PNL_HISTORY = "SELECT * FROM daily_pnl ORDER BY date DESC LIMIT ?"
+# Keyset page: a range scan on the date primary key, read backwards
+_SQL_GET_PNL_PAGE = "SELECT * FROM daily_pnl WHERE date < ? ORDER BY date DESC LIMIT ?"
+
+_SQL_SAVE_STATE = """
+    INSERT OR REPLACE INTO bot_state (key, value, updated_at)
+    VALUES (?, ?, ?)
+"""
+_SQL_GET_STATE = "SELECT value FROM bot_state WHERE key = ?"
+_SQL_DELETE_STATE = "DELETE FROM bot_state WHERE key = ?"
+
+# Whole-range P&L rollup; the SUMs run over INTEGER micro-unit columns inside SQLite
+_SQL_AGGREGATE_PNL = """
+    SELECT
+        COUNT(*) as days,
+        COALESCE(SUM(trades_count), 0) as trades_count,
+        COALESCE(SUM(total_volume), 0) as total_volume,
+        COALESCE(SUM(realized_pnl), 0) as realized_pnl,
+        COALESCE(SUM(expected_pnl), 0) as expected_pnl,
+        COALESCE(MAX(max_drawdown), 0) as max_drawdown,
+        COALESCE(MAX(peak_pnl), 0) as peak_pnl
+    FROM daily_pnl
+    WHERE date BETWEEN ? AND ?
+"""
+
+_SQL_TOTAL_REALIZED_PNL = "SELECT total_realized_pnl as total FROM summary WHERE id = 0"
+
+_SQL_STATISTICS = """
+    SELECT 
+        COUNT(*) as total_positions,
+        COUNT(*) FILTER (WHERE status = 'open') as open_positions,
+        COUNT(*) FILTER (WHERE status = 'closed') as closed_positions,
+        COALESCE(SUM(realized_pnl), 0) as total_realized_pnl,
+        COALESCE(SUM(entry_cost), 0) as total_volume,
+        (SELECT COUNT(*) FROM trades) as total_trades
+    FROM positions
+"""
+
+# Rows fetched per lock hold by the iter_* methods
+_ITER_PAGE_SIZE = 256
+
+# Decoded positions kept for unchanged rows; cleared wholesale when full
+_POSITION_CACHE_MAX = 4096
+
+# Write-behind batching: a batch closes at this many writes or after this window
+_WRITE_BATCH_MAX = 256
+_WRITE_BATCH_WINDOW = 0.05  # seconds
+_WRITE_QUEUE_MAX = 10_000  # save_*_async blocks once this many writes are pending
+
+# Per-connection prepared statement cache, well above the number of SQL constants
+_CACHED_STATEMENTS = 256
 
 
 class PositionStatus(Enum):
@@ -22,24 +363,32 @@ class PositionStatus(Enum):
     RESOLVED = "resolved"
 
 
-@dataclass
+# Plain dict lookup; PositionStatus(value) goes through EnumMeta.__call__
+_STATUS_BY_VALUE = {status.value: status for status in PositionStatus}
+
+
+@dataclass(frozen=True, slots=True)
 class StoredPosition:
-    """Position data for storage (avoids circular imports)."""
+    """
+    Position data for storage (avoids circular imports).
+    Sizes, prices and USDC amounts are integer micro-units (see units.py).
+    Frozen, since decoded records are shared through the Database position cache.
+    """
     position_id: str
     condition_id: str
     yes_token_id: str
     no_token_id: str
-    size: Decimal
-    yes_entry_price: Decimal
-    no_entry_price: Decimal
-    entry_cost: Decimal
+    size: int
+    yes_entry_price: int
+    no_entry_price: int
+    entry_cost: int
     entry_time: float
-    yes_exit_price: Optional[Decimal] = None
-    no_exit_price: Optional[Decimal] = None
-    exit_proceeds: Optional[Decimal] = None
+    yes_exit_price: Optional[int] = None
+    no_exit_price: Optional[int] = None
+    exit_proceeds: Optional[int] = None
     exit_time: Optional[float] = None
     status: PositionStatus = PositionStatus.OPEN
-    realized_pnl: Decimal = Decimal("0")
+    realized_pnl: int = 0
     execution_id: Optional[str] = None
     notes: str = ""
 
@@ -57,205 +406,427 @@ class Database:
     
     def __init__(self, db_path: str = "arb_bot.db"):
         self.db_path = Path(db_path)
+        
+        # One persistent connection, opened lazily and shared under the lock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        
+        # position_id -> (updated_at, decoded record), guarded by the lock.
+        # Returned records are shared; StoredPosition is frozen for that reason.
+        self._position_cache: dict[str, tuple[float, StoredPosition]] = {}
+        
+        # Write-behind queue for save_*_async, drained by a lazily started thread.
+        # None on the queue stops the writer.
+        self._write_queue: queue.Queue[Optional[tuple[str, tuple]]] = queue.Queue(
+            maxsize=_WRITE_QUEUE_MAX
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()  # Guards _writer, _closed and enqueueing
+        self._write_error: Optional[BaseException] = None
+        self._closed = False  # Set by close(); refuses further queued writes
+        
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure the persistent connection."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
     @contextmanager
     def _get_conn(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get database connection with context manager."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Get the shared connection; commits on success, rolls back on error."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            conn = self._conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def _iter_rows(
+        self,
+        convert: Callable[[Any], Any],
+        sql: str,
+        params: tuple = (),
+        named_rows: bool = False,
+    ) -> Generator[Any, None, None]:
+        """
+        Yield converted rows a page at a time, without fetching them all first.
+        The lock is held only while a page is fetched and converted, never across
+        a yield, so a half-consumed iterator doesn't stall the writer or close().
+        With named_rows, convert gets sqlite3.Row instead of plain tuples.
+        """
+        with self._get_conn() as conn:
+            cursor = self._named_cursor(conn) if named_rows else conn.cursor()
+            cursor.execute(sql, params)
+            page = [convert(row) for row in cursor.fetchmany(_ITER_PAGE_SIZE)]
+        while page:
+            yield from page
+            if len(page) < _ITER_PAGE_SIZE:
+                return
+            with self._get_conn():
+                page = [convert(row) for row in cursor.fetchmany(_ITER_PAGE_SIZE)]
+    
+    @staticmethod
+    def _named_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """Cursor returning sqlite3.Row, for reads that address columns by name."""
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor
+    
+    # === Write-behind ===
+    
+    def _enqueue_write(self, sql: str, params: tuple) -> None:
+        """
+        Queue a write for the background writer, starting it if needed.
+        Raises RuntimeError after close(), since nothing would drain the write.
+        """
+        # Held across put() so no write can land behind close()'s stop sentinel
+        with self._writer_lock:
+            if self._closed:
+                raise RuntimeError("Database is closed; write-behind is stopped")
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_behind_loop,
+                    name="db-write-behind",
+                    daemon=True,
+                )
+                self._writer.start()
+            self._write_queue.put((sql, params))
+    
+    def _write_behind_loop(self) -> None:
+        """Drain queued writes into batched transactions until told to stop."""
+        write_queue = self._write_queue
+        while True:
+            batch = [write_queue.get()]
+            deadline = time.monotonic() + _WRITE_BATCH_WINDOW
+            while batch[-1] is not None and len(batch) < _WRITE_BATCH_MAX:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(write_queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            writes = [write for write in batch if write is not None]
+            try:
+                if writes:
+                    with self._get_conn() as conn:
+                        conn.execute("BEGIN IMMEDIATE")
+                        # Consecutive writes to the same statement share one executemany
+                        for sql, group in groupby(writes, key=lambda write: write[0]):
+                            conn.executemany(sql, [params for _, params in group])
+            except Exception as e:
+                self._write_error = e  # Surfaced by the next flush()
+            finally:
+                for _ in batch:
+                    write_queue.task_done()
+            
+            if batch[-1] is None:
+                return
+    
+    def flush(self) -> None:
+        """Block until every queued write is committed; re-raise a writer failure."""
+        if self._writer is not None:
+            self._write_queue.join()
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+    
+    def close(self) -> None:
+        """
+        Flush queued writes, stop the writer and close the persistent connection.
+        Later save_*_async calls raise; synchronous calls reopen the connection.
+        """
+        with self._writer_lock:
+            self._closed = True
+            writer = self._writer
+            if writer is not None:
+                self._write_queue.put(None)
+                self._writer = None
+        if writer is not None:
+            writer.join()
+        
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("PRAGMA optimize")
+                self._conn.close()
+                self._conn = None
+        
+        # Report a write-behind failure that no flush() picked up
+        self.flush()
     
     def _init_db(self) -> None:
         """Initialize database schema."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
+            # Single-fsync appends, and readers don't block on the writer
+            conn.execute("PRAGMA journal_mode=WAL")
             
-            # Positions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS positions (
-                    position_id TEXT PRIMARY KEY,
-                    condition_id TEXT NOT NULL,
-                    yes_token_id TEXT NOT NULL,
-                    no_token_id TEXT NOT NULL,
-                    size TEXT NOT NULL,
-                    yes_entry_price TEXT NOT NULL,
-                    no_entry_price TEXT NOT NULL,
-                    entry_cost TEXT NOT NULL,
-                    entry_time REAL NOT NULL,
-                    yes_exit_price TEXT,
-                    no_exit_price TEXT,
-                    exit_proceeds TEXT,
-                    exit_time REAL,
-                    status TEXT NOT NULL,
-                    realized_pnl TEXT DEFAULT '0',
-                    execution_id TEXT,
-                    notes TEXT DEFAULT '',
-                    created_at REAL DEFAULT (strftime('%s', 'now')),
-                    updated_at REAL DEFAULT (strftime('%s', 'now'))
-                )
-            """)
+            # Market/token id dictionaries and positions table
+            conn.execute(_SQL_CREATE_MARKETS)
+            conn.execute(_SQL_CREATE_TOKENS)
+            self._migrate_positions(conn)
+            conn.execute(_SQL_CREATE_POSITIONS.format(table="positions"))
             
             # Trades table (individual fills)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS trades (
-                    trade_id TEXT PRIMARY KEY,
-                    position_id TEXT,
-                    execution_id TEXT,
-                    token_id TEXT NOT NULL,
-                    side TEXT NOT NULL,
-                    price TEXT NOT NULL,
-                    size TEXT NOT NULL,
-                    fee TEXT DEFAULT '0',
-                    timestamp REAL NOT NULL,
-                    order_id TEXT,
-                    FOREIGN KEY (position_id) REFERENCES positions(position_id)
-                )
-            """)
+            self._migrate_trades(conn)
+            conn.execute(_SQL_CREATE_TRADES.format(table="trades"))
             
             # Daily P&L table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS daily_pnl (
-                    date TEXT PRIMARY KEY,
-                    trades_count INTEGER DEFAULT 0,
-                    total_volume TEXT DEFAULT '0',
-                    realized_pnl TEXT DEFAULT '0',
-                    expected_pnl TEXT DEFAULT '0',
-                    max_drawdown TEXT DEFAULT '0',
-                    peak_pnl TEXT DEFAULT '0',
-                    updated_at REAL DEFAULT (strftime('%s', 'now'))
-                )
-            """)
+            self._migrate_to_micros(
+                conn, "daily_pnl", _SQL_CREATE_DAILY_PNL, _DAILY_PNL_AMOUNT_COLUMNS
+            )
+            conn.execute(_SQL_CREATE_DAILY_PNL.format(table="daily_pnl"))
             
             # Bot state table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS bot_state (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    updated_at REAL DEFAULT (strftime('%s', 'now'))
-                )
-            """)
+            conn.execute(_SQL_CREATE_BOT_STATE)
+            
+            # Materialized position totals
+            for statement in _SQL_CREATE_SUMMARY:
+                conn.execute(statement)
             
             # Indexes
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_positions_status 
-                ON positions(status)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_positions_condition 
-                ON positions(condition_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_trades_position 
-                ON trades(position_id)
-            """)
+            for statement in _SQL_CREATE_INDEXES:
+                conn.execute(statement)
+            
+            # Planner statistics, so index choices don't fall back to guesses
+            conn.execute("ANALYZE")
+    
+    def _migrate_positions(self, conn: sqlite3.Connection) -> None:
+        """
+        Rebuild an older positions table as schema v3: decimal TEXT amounts (v1)
+        become INTEGER micro-units and text ids (v1, v2) become interned keys.
+        """
+        columns = {
+            name: column_type
+            for _, name, column_type, *_ in conn.execute("PRAGMA table_info(positions)")
+        }
+        if not columns or "condition_int_id" in columns:
+            return  # Fresh database or already migrated
+        
+        def amount(name: str) -> str:
+            if columns[name] == "TEXT":
+                return f"CAST(ROUND(CAST(p.{name} AS REAL) * 1000000) AS INTEGER)"
+            return f"p.{name}"
+        
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "INSERT OR IGNORE INTO markets (condition_id) "
+            "SELECT condition_id FROM positions"
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO tokens (token_id) "
+            "SELECT yes_token_id FROM positions UNION SELECT no_token_id FROM positions"
+        )
+        conn.execute(_SQL_CREATE_POSITIONS.format(table="positions_v3"))
+        conn.execute(f"""
+            INSERT INTO positions_v3 (
+                position_id, condition_int_id, yes_token_int_id, no_token_int_id,
+                size, yes_entry_price, no_entry_price, entry_cost,
+                entry_time, yes_exit_price, no_exit_price, exit_proceeds,
+                exit_time, status, realized_pnl, execution_id, notes,
+                created_at, updated_at
+            )
+            SELECT p.position_id, m.market_int_id, yt.token_int_id, nt.token_int_id,
+                {amount("size")}, {amount("yes_entry_price")},
+                {amount("no_entry_price")}, {amount("entry_cost")},
+                p.entry_time, {amount("yes_exit_price")},
+                {amount("no_exit_price")}, {amount("exit_proceeds")},
+                p.exit_time, p.status, {amount("realized_pnl")}, p.execution_id, p.notes,
+                p.created_at, p.updated_at
+            FROM positions p
+            JOIN markets m ON m.condition_id = p.condition_id
+            JOIN tokens yt ON yt.token_id = p.yes_token_id
+            JOIN tokens nt ON nt.token_id = p.no_token_id
+        """)
+        conn.execute("DROP TABLE positions")
+        conn.execute("ALTER TABLE positions_v3 RENAME TO positions")
+    
+    def _migrate_trades(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a pre-v3 trades table with its text token_id as an interned key."""
+        columns = [name for _, name, *_ in conn.execute("PRAGMA table_info(trades)")]
+        if "token_id" not in columns:
+            return  # Fresh database or already migrated
+        
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "INSERT OR IGNORE INTO tokens (token_id) SELECT DISTINCT token_id FROM trades"
+        )
+        conn.execute(_SQL_CREATE_TRADES.format(table="trades_v3"))
+        conn.execute("""
+            INSERT INTO trades_v3 (
+                trade_id, position_id, execution_id, token_int_id,
+                side, price, size, fee, timestamp, order_id
+            )
+            SELECT t.trade_id, t.position_id, t.execution_id, k.token_int_id,
+                t.side, t.price, t.size, t.fee, t.timestamp, t.order_id
+            FROM trades t
+            JOIN tokens k ON k.token_id = t.token_id
+        """)
+        conn.execute("DROP TABLE trades")
+        conn.execute("ALTER TABLE trades_v3 RENAME TO trades")
+    
+    def _migrate_to_micros(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        create_sql: str,
+        amount_columns: tuple[str, ...],
+    ) -> None:
+        """Rewrite a v1 table (decimal TEXT amounts) as INTEGER micro-units."""
+        columns = {
+            name: column_type
+            for _, name, column_type, *_ in conn.execute(f"PRAGMA table_info({table})")
+        }
+        if columns.get(amount_columns[0]) != "TEXT":
+            return  # Fresh database or already migrated
+        
+        converted = [
+            f"CAST(ROUND(CAST({name} AS REAL) * 1000000) AS INTEGER)"
+            if name in amount_columns else name
+            for name in columns
+        ]
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        conn.execute(create_sql.format(table=f"{table}_v2"))
+        conn.execute(
+            f"INSERT INTO {table}_v2 ({', '.join(columns)}) "
+            f"SELECT {', '.join(converted)} FROM {table}"
+        )
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {table}_v2 RENAME TO {table}")
     
     # === Position Operations ===
     
     def save_position(self, position: Any) -> None:
         """Save or update a position."""
+        params = self._position_params(position, time.time())
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO positions (
-                    position_id, condition_id, yes_token_id, no_token_id,
-                    size, yes_entry_price, no_entry_price, entry_cost,
-                    entry_time, yes_exit_price, no_exit_price, exit_proceeds,
-                    exit_time, status, realized_pnl, execution_id, notes,
-                    updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                position.position_id,
-                position.condition_id,
-                position.yes_token_id,
-                position.no_token_id,
-                str(position.size),
-                str(position.yes_entry_price),
-                str(position.no_entry_price),
-                str(position.entry_cost),
-                position.entry_time,
-                str(position.yes_exit_price) if position.yes_exit_price else None,
-                str(position.no_exit_price) if position.no_exit_price else None,
-                str(position.exit_proceeds) if position.exit_proceeds else None,
-                position.exit_time,
-                position.status.value,
-                str(position.realized_pnl),
-                position.execution_id,
-                position.notes,
-                time.time(),
-            ))
+            self._intern_ids(conn, [params])
+            conn.execute(_SQL_SAVE_POSITION, params)
+            self._position_cache.pop(position.position_id, None)
+    
+    def save_positions_bulk(self, positions: Iterable[Any]) -> None:
+        """Save or update many positions in one transaction."""
+        now = time.time()
+        params = [self._position_params(position, now) for position in positions]
+        if not params:
+            return
+        with self._get_conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._intern_ids(conn, params)
+            conn.executemany(_SQL_SAVE_POSITION, params)
+            for row in params:
+                self._position_cache.pop(row[0], None)
+    
+    @staticmethod
+    def _intern_ids(conn: sqlite3.Connection, params: list[tuple]) -> None:
+        """Ensure the market and token ids in position params have dictionary rows."""
+        markets = {row[1] for row in params}
+        tokens = {token_id for row in params for token_id in (row[2], row[3])}
+        conn.executemany(_SQL_INTERN_MARKET, [(condition_id,) for condition_id in markets])
+        conn.executemany(_SQL_INTERN_TOKEN, [(token_id,) for token_id in tokens])
+    
+    @staticmethod
+    def _position_params(position: Any, updated_at: float) -> tuple:
+        """Bind parameters for _SQL_SAVE_POSITION."""
+        return (
+            position.position_id,
+            position.condition_id,
+            position.yes_token_id,
+            position.no_token_id,
+            position.size,
+            position.yes_entry_price,
+            position.no_entry_price,
+            position.entry_cost,
+            position.entry_time,
+            position.yes_exit_price,
+            position.no_exit_price,
+            position.exit_proceeds,
+            position.exit_time,
+            position.status.value,
+            position.realized_pnl,
+            position.execution_id,
+            position.notes,
+            updated_at,
+        )
     
     def get_position(self, position_id: str) -> Optional[StoredPosition]:
         """Get a position by ID."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM positions WHERE position_id = ?",
-                (position_id,)
-            )
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_GET_POSITION, (position_id,)).fetchone()
             
             if row:
-                return self._row_to_position(row)
+                return self._row_to_position_cached(row)
             return None
     
+    def iter_open_positions(self) -> Iterator[StoredPosition]:
+        """Iterate over open positions."""
+        return self._iter_rows(self._row_to_position_cached, _SQL_GET_OPEN_POSITIONS)
+    
     def get_open_positions(self) -> list[StoredPosition]:
         """Get all open positions."""
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM positions WHERE status = ?",
-                (PositionStatus.OPEN.value,)
-            )
-            return [self._row_to_position(row) for row in cursor.fetchall()]
+        return list(self.iter_open_positions())
+    
+    def iter_positions_by_market(self, condition_id: str) -> Iterator[StoredPosition]:
+        """Iterate over positions for a market."""
+        return self._iter_rows(
+            self._row_to_position_cached, _SQL_GET_POSITIONS_BY_MARKET, (condition_id,)
+        )
     
     def get_positions_by_market(self, condition_id: str) -> list[StoredPosition]:
         """Get all positions for a market."""
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM positions WHERE condition_id = ?",
-                (condition_id,)
-            )
-            return [self._row_to_position(row) for row in cursor.fetchall()]
+        return list(self.iter_positions_by_market(condition_id))
+    
+    def iter_all_positions(self, limit: int = 100) -> Iterator[StoredPosition]:
+        """Iterate over positions, newest first, up to limit."""
+        return self._iter_rows(
+            self._row_to_position_cached, _SQL_GET_RECENT_POSITIONS, (limit,)
+        )
     
     def get_all_positions(self, limit: int = 100) -> list[StoredPosition]:
         """Get all positions with limit."""
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM positions ORDER BY entry_time DESC LIMIT ?",
-                (limit,)
-            )
-            return [self._row_to_position(row) for row in cursor.fetchall()]
+        return list(self.iter_all_positions(limit))
+    
+    def _row_to_position_cached(self, row: tuple) -> StoredPosition:
+        """Decode a position row, reusing the cached record if updated_at is unchanged."""
+        position_id, updated_at = row[0], row[17]
+        cached = self._position_cache.get(position_id)
+        if cached is not None and cached[0] == updated_at:
+            return cached[1]
+        
+        position = self._row_to_position(row)
+        if len(self._position_cache) >= _POSITION_CACHE_MAX:
+            self._position_cache.clear()
+        self._position_cache[position_id] = (updated_at, position)
+        return position
     
-    def _row_to_position(self, row: sqlite3.Row) -> StoredPosition:
-        """Convert database row to StoredPosition."""
+    @staticmethod
+    def _row_to_position(row: tuple) -> StoredPosition:
+        """Convert a _SQL_SELECT_POSITIONS tuple to StoredPosition."""
+        (
+            position_id, condition_id, yes_token_id, no_token_id,
+            size, yes_entry_price, no_entry_price, entry_cost,
+            entry_time, yes_exit_price, no_exit_price, exit_proceeds,
+            exit_time, status, realized_pnl, execution_id, notes, _,
+        ) = row
         return StoredPosition(
-            position_id=row["position_id"],
-            condition_id=row["condition_id"],
-            yes_token_id=row["yes_token_id"],
-            no_token_id=row["no_token_id"],
-            size=Decimal(row["size"]),
-            yes_entry_price=Decimal(row["yes_entry_price"]),
-            no_entry_price=Decimal(row["no_entry_price"]),
-            entry_cost=Decimal(row["entry_cost"]),
-            entry_time=row["entry_time"],
-            yes_exit_price=Decimal(row["yes_exit_price"]) if row["yes_exit_price"] else None,
-            no_exit_price=Decimal(row["no_exit_price"]) if row["no_exit_price"] else None,
-            exit_proceeds=Decimal(row["exit_proceeds"]) if row["exit_proceeds"] else None,
-            exit_time=row["exit_time"],
-            status=PositionStatus(row["status"]),
-            realized_pnl=Decimal(row["realized_pnl"]),
-            execution_id=row["execution_id"],
-            notes=row["notes"] or "",
+            position_id, condition_id, yes_token_id, no_token_id,
+            size, yes_entry_price, no_entry_price, entry_cost,
+            entry_time, yes_exit_price, no_exit_price, exit_proceeds,
+            exit_time, _STATUS_BY_VALUE[status], realized_pnl, execution_id, notes,
         )
     
     # === Trade Operations ===
@@ -275,44 +846,80 @@ class Database:
     ) -> None:
         """Save a trade record."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO trades (
-                    trade_id, position_id, execution_id, token_id,
-                    side, price, size, fee, timestamp, order_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade_id,
-                position_id,
-                execution_id,
-                token_id,
-                side,
-                str(price),
-                str(size),
-                str(fee),
-                timestamp,
-                order_id,
+            conn.execute(_SQL_INTERN_TOKEN, (token_id,))
+            conn.execute(_SQL_SAVE_TRADE, self._trade_params(
+                trade_id, token_id, side, price, size, timestamp,
+                position_id, execution_id, order_id, fee,
             ))
     
+    def save_trade_async(self, **trade: Any) -> None:
+        """
+        Queue a trade record for the background writer.
+        Takes save_trade's keyword arguments; flush() or close() makes it durable.
+        """
+        params = self._trade_params(**trade)
+        # The queue is FIFO, so the token is interned before the trade resolves it
+        self._enqueue_write(_SQL_INTERN_TOKEN, (params[3],))
+        self._enqueue_write(_SQL_SAVE_TRADE, params)
+    
+    def save_trades_bulk(self, trades: Iterable[dict[str, Any]]) -> None:
+        """
+        Save many trade records in one transaction.
+        Each item holds save_trade's keyword arguments.
+        """
+        params = [self._trade_params(**trade) for trade in trades]
+        if not params:
+            return
+        with self._get_conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            tokens = {row[3] for row in params}
+            conn.executemany(_SQL_INTERN_TOKEN, [(token_id,) for token_id in tokens])
+            conn.executemany(_SQL_SAVE_TRADE, params)
+    
+    @staticmethod
+    def _trade_params(
+        trade_id: str,
+        token_id: str,
+        side: str,
+        price: Decimal,
+        size: Decimal,
+        timestamp: float,
+        position_id: Optional[str] = None,
+        execution_id: Optional[str] = None,
+        order_id: Optional[str] = None,
+        fee: Decimal = Decimal("0"),
+    ) -> tuple:
+        """Bind parameters for _SQL_SAVE_TRADE."""
+        return (
+            trade_id,
+            position_id,
+            execution_id,
+            token_id,
+            side,
+            str(price),
+            str(size),
+            str(fee),
+            timestamp,
+            order_id,
+        )
+    
+    def iter_trades_for_position(self, position_id: str) -> Iterator[dict]:
+        """Iterate over trades for a position, oldest first."""
+        return self._iter_rows(
+            dict, _SQL_GET_TRADES_FOR_POSITION, (position_id,), named_rows=True
+        )
+    
     def get_trades_for_position(self, position_id: str) -> list[dict]:
         """Get all trades for a position."""
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM trades WHERE position_id = ? ORDER BY timestamp",
-                (position_id,)
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_trades_for_position(position_id))
+    
+    def iter_recent_trades(self, limit: int = 50) -> Iterator[dict]:
+        """Iterate over recent trades, newest first."""
+        return self._iter_rows(dict, _SQL_GET_RECENT_TRADES, (limit,), named_rows=True)
     
     def get_recent_trades(self, limit: int = 50) -> list[dict]:
         """Get recent trades."""
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM trades ORDER BY timestamp DESC LIMIT ?",
-                (limit,)
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_recent_trades(limit))
     
     # === Daily P&L Operations ===
     
@@ -328,124 +935,119 @@ class Database:
     ) -> None:
         """Update daily P&L record."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO daily_pnl (
-                    date, trades_count, total_volume, realized_pnl,
-                    expected_pnl, max_drawdown, peak_pnl, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    trades_count = trades_count + excluded.trades_count,
-                    total_volume = CAST(
-                        CAST(total_volume AS REAL) + CAST(excluded.total_volume AS REAL) 
-                        AS TEXT
-                    ),
-                    realized_pnl = excluded.realized_pnl,
-                    expected_pnl = excluded.expected_pnl,
-                    max_drawdown = excluded.max_drawdown,
-                    peak_pnl = excluded.peak_pnl,
-                    updated_at = excluded.updated_at
-            """, (
+            conn.execute(_SQL_UPSERT_DAILY_PNL, (
                 date,
                 trades_count,
-                str(volume),
-                str(realized_pnl),
-                str(expected_pnl),
-                str(max_drawdown),
-                str(peak_pnl),
+                to_micros(volume),
+                to_micros(realized_pnl),
+                to_micros(expected_pnl),
+                to_micros(max_drawdown),
+                to_micros(peak_pnl),
                 time.time(),
             ))
     
     def get_daily_pnl(self, date: str) -> Optional[dict]:
         """Get daily P&L for a specific date."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM daily_pnl WHERE date = ?",
-                (date,)
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            row = self._named_cursor(conn).execute(_SQL_GET_DAILY_PNL, (date,)).fetchone()
+            return self._row_to_daily_pnl(row) if row else None
+    
+    def iter_pnl_history(self, days: int = 30) -> Iterator[dict]:
+        """Iterate over P&L records for the last N days, newest first."""
+        return self._iter_rows(
+            self._row_to_daily_pnl, _SQL_GET_PNL_HISTORY, (days,), named_rows=True
+        )
     
     def get_pnl_history(self, days: int = 30) -> list[dict]:
         """Get P&L history for last N days."""
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM daily_pnl ORDER BY date DESC LIMIT ?",
-                (days,)
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_pnl_history(days))
+    
+    def iter_pnl_since(
+        self,
+        cursor_date: Optional[str] = None,
+        batch: int = 100,
+    ) -> Iterator[dict]:
+        """
+        Page through P&L records dated before cursor_date (all if None), newest first.
+        Each page is fetched under its own lock hold, keyed on the last date seen.
+        """
+        while True:
+            with self._get_conn() as conn:
+                cursor = self._named_cursor(conn)
+                if cursor_date is None:
+                    rows = cursor.execute(_SQL_GET_PNL_HISTORY, (batch,)).fetchall()
+                else:
+                    rows = cursor.execute(_SQL_GET_PNL_PAGE, (cursor_date, batch)).fetchall()
+            for row in rows:
+                yield self._row_to_daily_pnl(row)
+            if len(rows) < batch:
+                return
+            cursor_date = rows[-1]["date"]
+    
+    @staticmethod
+    def _row_to_daily_pnl(row: sqlite3.Row) -> dict:
+        """Convert a daily_pnl row to a dict with Decimal amounts."""
+        record = dict(row)
+        for name in _DAILY_PNL_AMOUNT_COLUMNS:
+            record[name] = from_micros(record[name])
+        return record
     
     # === Bot State Operations ===
     
     def save_state(self, key: str, value: Any) -> None:
         """Save bot state value."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO bot_state (key, value, updated_at)
-                VALUES (?, ?, ?)
-            """, (key, json.dumps(value), time.time()))
+            conn.execute(_SQL_SAVE_STATE, (key, _json_dumps(value), time.time()))
+    
+    def save_state_async(self, key: str, value: Any) -> None:
+        """Queue a bot state value for the background writer."""
+        self._enqueue_write(_SQL_SAVE_STATE, (key, _json_dumps(value), time.time()))
     
     def get_state(self, key: str, default: Any = None) -> Any:
         """Get bot state value."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT value FROM bot_state WHERE key = ?",
-                (key,)
-            )
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_GET_STATE, (key,)).fetchone()
             if row:
-                return json.loads(row["value"])
+                return _json_loads(row[0])
             return default
     
     def delete_state(self, key: str) -> None:
         """Delete bot state value."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM bot_state WHERE key = ?", (key,))
+            conn.execute(_SQL_DELETE_STATE, (key,))
     
     # === Utility Operations ===
     
     def get_total_realized_pnl(self) -> Decimal:
         """Get total realized P&L across all positions."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT COALESCE(SUM(CAST(realized_pnl AS REAL)), 0) as total FROM positions"
-            )
-            row = cursor.fetchone()
-            return Decimal(str(row["total"])) if row else Decimal("0")
+            row = conn.execute(_SQL_TOTAL_REALIZED_PNL).fetchone()
+            return from_micros(row[0]) if row else Decimal("0")
+    
+    def aggregate_pnl(self, start: str, end: str) -> dict:
+        """Roll up daily P&L for dates in [start, end] with Decimal amounts."""
+        with self._get_conn() as conn:
+            row = self._named_cursor(conn).execute(_SQL_AGGREGATE_PNL, (start, end)).fetchone()
+        totals = dict(row)
+        for name in _DAILY_PNL_AMOUNT_COLUMNS:
+            totals[name] = from_micros(totals[name])
+        return totals
     
     def get_statistics(self) -> dict:
         """Get overall statistics."""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            
-            # Position stats
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_positions,
-                    SUM(CASE WHEN status = 'open' THEN 1 ELSE 0 END) as open_positions,
-                    SUM(CASE WHEN status = 'closed' THEN 1 ELSE 0 END) as closed_positions,
-                    SUM(CAST(realized_pnl AS REAL)) as total_realized_pnl,
-                    SUM(CAST(entry_cost AS REAL)) as total_volume
-                FROM positions
-            """)
-            pos_stats = dict(cursor.fetchone())
-            
-            # Trade stats
-            cursor.execute("SELECT COUNT(*) as total_trades FROM trades")
-            trade_stats = dict(cursor.fetchone())
-            
-            return {
-                **pos_stats,
-                **trade_stats,
-            }
+            stats = dict(self._named_cursor(conn).execute(_SQL_STATISTICS).fetchone())
+        stats["total_realized_pnl"] = from_micros(stats["total_realized_pnl"])
+        stats["total_volume"] = from_micros(stats["total_volume"])
+        return stats
+    
+    def checkpoint(self) -> None:
+        """Copy the WAL into the database file and truncate it to zero bytes."""
+        with self._get_conn() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     
     def vacuum(self) -> None:
         """Optimize database."""
         with self._get_conn() as conn:
             conn.execute("VACUUM")
+        self.checkpoint()
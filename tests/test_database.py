@@ -0,0 +1,128 @@
+"""Tests for storage/database.py."""
+
+import dataclasses
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from decimal import Decimal
+
+from polymarket_arb_bot.storage.database import Database, StoredPosition
+
+
+class WriteBehindTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.db = Database(os.path.join(tempfile.mkdtemp(), "test.db"))
+    
+    def tearDown(self):
+        self.db.close()
+    
+    def test_close_flushes_queued_writes(self):
+        self.db.save_state_async("key", {"value": 1})
+        self.db.close()
+        self.assertEqual(self.db.get_state("key"), {"value": 1})
+    
+    def test_async_write_after_close_is_refused(self):
+        self.db.close()
+        with self.assertRaises(RuntimeError):
+            self.db.save_state_async("key", 1)
+        self.assertIsNone(self.db._writer)
+
+
+class IterRowsTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.db = Database(os.path.join(tempfile.mkdtemp(), "test.db"))
+        self.db.save_positions_bulk(
+            StoredPosition(f"p{i}", "cond", "yes", "no", 1, 1, 1, 1, float(i))
+            for i in range(1000)
+        )
+    
+    def tearDown(self):
+        self.db.close()
+    
+    def test_iterates_every_row_across_pages(self):
+        ids = {position.position_id for position in self.db.iter_open_positions()}
+        self.assertEqual(len(ids), 1000)
+    
+    def test_partial_iteration_does_not_hold_the_lock(self):
+        positions = self.db.iter_open_positions()
+        next(positions)
+        
+        # Another thread must be able to write while the iterator is suspended
+        writer = threading.Thread(target=self.db.save_state, args=("key", 1))
+        writer.start()
+        writer.join(timeout=5)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(sum(1 for _ in positions), 999)
+
+    
+    def test_cached_positions_are_immutable(self):
+        position = self.db.get_position("p0")
+        self.assertIs(self.db.get_position("p0"), position)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            position.size = 2
+
+
+
+class TradeTokenTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "test.db")
+    
+    def _trade(self, trade_id: str, token_id: str, timestamp: float) -> dict:
+        return dict(
+            trade_id=trade_id, token_id=token_id, side="BUY",
+            price=Decimal("0.45"), size=Decimal("10"), timestamp=timestamp,
+            position_id="p1",
+        )
+    
+    def test_token_id_round_trips_through_every_save_path(self):
+        db = Database(self.path)
+        try:
+            db.save_trade(**self._trade("t1", "tok-a", 1.0))
+            db.save_trade_async(**self._trade("t2", "tok-b", 2.0))
+            db.save_trades_bulk([self._trade("t3", "tok-a", 3.0), self._trade("t4", "tok-c", 4.0)])
+            db.flush()
+            
+            trades = db.get_trades_for_position("p1")
+            self.assertEqual(
+                [(t["trade_id"], t["token_id"]) for t in trades],
+                [("t1", "tok-a"), ("t2", "tok-b"), ("t3", "tok-a"), ("t4", "tok-c")],
+            )
+            self.assertEqual(db.get_recent_trades(1)[0]["price"], "0.45")
+        finally:
+            db.close()
+    
+    def test_text_token_ids_are_migrated(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("""
+            CREATE TABLE trades (
+                trade_id TEXT PRIMARY KEY, position_id TEXT, execution_id TEXT,
+                token_id TEXT NOT NULL, side TEXT NOT NULL, price TEXT NOT NULL,
+                size TEXT NOT NULL, fee TEXT DEFAULT '0', timestamp REAL NOT NULL,
+                order_id TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO trades VALUES ('t1', 'p1', NULL, 'tok-a', 'BUY', '0.45', '10', '0', 1.0, NULL)"
+        )
+        conn.commit()
+        conn.close()
+        
+        db = Database(self.path)
+        try:
+            trades = db.get_trades_for_position("p1")
+            self.assertEqual([(t["trade_id"], t["token_id"]) for t in trades], [("t1", "tok-a")])
+            with db._get_conn() as conn:
+                columns = [row[1] for row in conn.execute("PRAGMA table_info(trades)")]
+            self.assertIn("token_int_id", columns)
+            self.assertNotIn("token_id", columns)
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for orderbook/book.py."""
+
+import random
+import unittest
+from decimal import Decimal
+
+from polymarket_arb_bot.orderbook.book import NO_PRICE, OrderBookManager, TokenBook
+
+
+class TokenBookTopOfBookTest(unittest.TestCase):
+    
+    def test_level_removal_clears_cached_top_of_book(self):
+        book = TokenBook("yes")
+        book.set_snapshot(
+            bids=[(Decimal("0.40"), Decimal("10"))],
+            asks=[(Decimal("0.45"), Decimal("10"))],
+        )
+        book.set_top_of_book(Decimal("0.40"), Decimal("0.45"))
+        
+        book.update_level("BUY", Decimal("0.40"), Decimal("0"))
+        book.update_level("SELL", Decimal("0.45"), Decimal("0"))
+        
+        self.assertIsNone(book.best_bid)
+        self.assertIsNone(book.best_ask)
+        self.assertIsNone(book.best_ask_size)
+    
+    def test_batch_removal_clears_cached_top_of_book(self):
+        book = TokenBook("yes")
+        book.set_snapshot(
+            bids=[(Decimal("0.40"), Decimal("10")), (Decimal("0.39"), Decimal("5"))],
+            asks=[(Decimal("0.45"), Decimal("10")), (Decimal("0.46"), Decimal("5"))],
+        )
+        book.set_top_of_book(Decimal("0.40"), Decimal("0.45"))
+        
+        book.apply_batch([
+            ("BUY", Decimal("0.40"), Decimal("0")),
+            ("SELL", Decimal("0.45"), Decimal("0")),
+        ])
+        
+        self.assertEqual(book.best_bid, Decimal("0.39"))
+        self.assertEqual(book.best_ask, Decimal("0.46"))
+        self.assertEqual(book.best_ask_size, Decimal("5"))
+    
+    def test_slot_arrays_follow_level_removal(self):
+        manager = OrderBookManager()
+        market = manager.add_market("cond", "yes", "no")
+        manager.update_book_snapshot(
+            "yes",
+            bids=[(Decimal("0.40"), Decimal("10"))],
+            asks=[(Decimal("0.45"), Decimal("10"))],
+        )
+        manager.update_best_bid_ask("yes", Decimal("0.40"), Decimal("0.45"))
+        
+        manager.update_price_level("yes", "BUY", Decimal("0.40"), Decimal("0"))
+        manager.update_price_level("yes", "SELL", Decimal("0.45"), Decimal("0"))
+        
+        self.assertEqual(manager.yes_bid_micros[market.slot], NO_PRICE)
+        self.assertEqual(manager.yes_ask_micros[market.slot], NO_PRICE)
+        self.assertEqual(market.yes_ask_micros, NO_PRICE)
+    
+    def test_one_sided_updates_match_full_resync(self):
+        rng = random.Random(7)
+        manager = OrderBookManager()
+        market = manager.add_market("cond", "yes", "no")
+        reference = OrderBookManager()
+        reference_market = reference.add_market("cond", "yes", "no")
+        
+        def price():
+            return Decimal(rng.randint(1, 99)) / 100
+        
+        for _ in range(500):
+            token = rng.choice(["yes", "no"])
+            kind = rng.randrange(3)
+            if kind == 0:
+                side = rng.choice(["BUY", "SELL"])
+                manager.update_price_level(token, side, price(), Decimal(rng.randint(0, 3)))
+            elif kind == 1:
+                updates = [
+                    (rng.choice(["BUY", "SELL"]), price(), Decimal(rng.randint(0, 3)))
+                    for _ in range(rng.randint(1, 4))
+                ]
+                manager.update_levels_batch(token, updates)
+            else:
+                manager.update_best_bid_ask(token, price(), price())
+            
+            # Rebuild the reference with a full two-sided sync of the same books
+            reference_market.yes_book = market.yes_book
+            reference_market.no_book = market.no_book
+            reference._sync_slot(reference_market, True)
+            reference._sync_slot(reference_market, False)
+            
+            for column in (
+                "yes_ask_micros", "no_ask_micros",
+                "yes_ask_size_micros", "no_ask_size_micros",
+                "yes_bid_micros", "no_bid_micros",
+            ):
+                self.assertEqual(
+                    getattr(manager, column)[market.slot],
+                    getattr(reference, column)[reference_market.slot],
+                    column,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for signals/parity_detector.py."""
+
+import dataclasses
+import unittest
+from decimal import Decimal
+
+from polymarket_arb_bot.config import FeeConfig, TradingConfig
+from polymarket_arb_bot.orderbook.book import OrderBookManager
+from polymarket_arb_bot.signals.parity_detector import ParityDetector
+
+
+def _set_asks(manager: OrderBookManager, token_id: str, ask: str) -> None:
+    manager.update_book_snapshot(token_id, bids=[], asks=[(Decimal(ask), Decimal("50"))])
+
+
+class LastSignalTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.manager = OrderBookManager()
+        self.manager.add_market("cond", "yes", "no")
+        self.detector = ParityDetector(self.manager, FeeConfig(), TradingConfig())
+        _set_asks(self.manager, "yes", "0.45")
+        _set_asks(self.manager, "no", "0.45")
+    
+    def test_collapsed_spread_drops_last_signal(self):
+        self.assertEqual(len(self.detector.scan_all_markets()), 1)
+        self.assertIsNotNone(self.detector.get_last_signal("cond"))
+        
+        _set_asks(self.manager, "yes", "0.60")
+        self.assertEqual(self.detector.scan_all_markets(), [])
+        self.assertIsNone(self.detector.get_last_signal("cond"))
+    
+    def test_unrelated_update_keeps_last_signal(self):
+        self.manager.add_market("other", "other-yes", "other-no")
+        self.detector.scan_all_markets()
+        
+        _set_asks(self.manager, "other-yes", "0.60")
+        self.detector.scan_all_markets()
+        signal = self.detector.get_last_signal("cond")
+        self.assertIsNotNone(signal)
+        self.assertEqual(signal.net_edge, Decimal("0.098"))
+    
+    def test_expired_last_signal_is_dropped(self):
+        signal = self.detector.get_best_opportunity()
+        self.detector._last_signals["cond"] = dataclasses.replace(
+            signal, timestamp_ns=signal.timestamp_ns - ParityDetector.SIGNAL_TTL_NS - 1,
+        )
+        self.assertIsNone(self.detector.get_last_signal("cond"))
+
+
+
+class EmitTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.manager = OrderBookManager()
+        for i, yes_ask in enumerate(("0.45", "0.40", "0.48")):
+            self.manager.add_market(f"cond-{i}", f"yes-{i}", f"no-{i}")
+            _set_asks(self.manager, f"yes-{i}", yes_ask)
+            _set_asks(self.manager, f"no-{i}", "0.45")
+        self.detector = ParityDetector(self.manager, FeeConfig(), TradingConfig())
+    
+    def test_batch_callback_receives_sorted_list(self):
+        batches = []
+        self.detector.on_signal_batch(batches.append)
+        
+        signals = self.detector.scan_all_markets()
+        
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0], signals)
+        self.assertEqual(
+            [signal.condition_id for signal in batches[0]],
+            ["cond-1", "cond-0", "cond-2"],
+        )
+    
+    def test_signal_callbacks_see_each_signal_despite_errors(self):
+        seen = []
+        
+        def failing(signal):
+            raise RuntimeError("callback failure")
+        
+        self.detector.on_signal(failing)
+        self.detector.on_signal(seen.append)
+        
+        signals = self.detector.scan_all_markets()
+        
+        self.assertEqual(seen, signals)
+
+
+if __name__ == "__main__":
+    unittest.main()
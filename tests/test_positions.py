@@ -0,0 +1,61 @@
+"""Tests for positions/manager.py."""
+
+import unittest
+
+from polymarket_arb_bot.positions.manager import PairedPosition, PositionManager, PositionStatus
+
+
+def _position(position_id: str, condition_id: str = "cond") -> PairedPosition:
+    return PairedPosition(
+        position_id=position_id,
+        condition_id=condition_id,
+        yes_token_id="yes",
+        no_token_id="no",
+        size=10_000_000,
+        yes_entry_price=450_000,
+        no_entry_price=500_000,
+        entry_cost=9_500_000,
+        entry_time=0.0,
+    )
+
+
+class PositionIndexOrderTest(unittest.TestCase):
+    
+    # Enough ids that a hash-ordered set would almost surely reorder them
+    IDS = [f"pos-{i:03d}" for i in range(200)]
+    
+    def test_open_positions_keep_insertion_order(self):
+        manager = PositionManager()
+        for position_id in self.IDS:
+            manager.add_position(_position(position_id))
+        
+        self.assertEqual([p.position_id for p in manager.get_open_positions()], self.IDS)
+        self.assertEqual(
+            [p.position_id for p in manager.get_positions_by_status(PositionStatus.OPEN)],
+            self.IDS,
+        )
+    
+    def test_removal_preserves_order_of_the_rest(self):
+        manager = PositionManager()
+        for position_id in self.IDS:
+            manager.add_position(_position(position_id))
+        for position_id in self.IDS[::3]:
+            manager.remove_position(position_id)
+        
+        remaining = [pid for i, pid in enumerate(self.IDS) if i % 3]
+        self.assertEqual([p.position_id for p in manager.get_open_positions()], remaining)
+    
+    def test_market_positions_keep_insertion_order(self):
+        manager = PositionManager()
+        for i, position_id in enumerate(self.IDS):
+            manager.add_position(_position(position_id, condition_id=f"cond-{i % 2}"))
+        manager.remove_position(self.IDS[0])
+        
+        self.assertEqual(
+            [p.position_id for p in manager.get_positions_for_market("cond-0")],
+            self.IDS[2::2],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests for signals/spot_lag.py."""
+
+import random
+import time
+import unittest
+from decimal import Decimal
+from typing import Optional
+
+from polymarket_arb_bot.signals.spot_lag import SpotData, SpotLagDetector
+
+
+class _FakeSpotFeed:
+    """Stands in for BinanceSpotFeed; serves one cached SpotData."""
+    
+    def __init__(self):
+        self.data: Optional[SpotData] = None
+    
+    def get_cached_price(self, symbol: str) -> Optional[SpotData]:
+        return self.data
+
+
+def _decimal_reference(
+    change_pct: Decimal,
+    up_price: Decimal,
+    down_price: Decimal,
+    min_edge: Decimal,
+    min_spot_move: Decimal,
+) -> Optional[tuple[str, Decimal, Decimal]]:
+    """
+    The Decimal check_opportunity math from before the float rewrite.
+    Returns (direction, fair_up_prob, edge), or None if no signal.
+    """
+    if abs(change_pct) < min_spot_move:
+        return None
+    
+    abs_move = abs(change_pct)
+    sign = Decimal("1") if change_pct >= 0 else Decimal("-1")
+    adjustment = Decimal("0")
+    for (min_move, max_move), value in SpotLagDetector.SPOT_MOVE_TO_PROB.items():
+        if Decimal(str(min_move)) <= abs_move < Decimal(str(max_move)):
+            adjustment = value * sign
+            break
+    
+    fair_up_prob = max(Decimal("0.05"), min(Decimal("0.95"), Decimal("0.50") + adjustment))
+    if change_pct > 0:
+        edge = fair_up_prob - up_price
+        direction = "UP"
+    else:
+        edge = (Decimal("1") - fair_up_prob) - down_price
+        direction = "DOWN"
+    
+    if edge < min_edge:
+        return None
+    return direction, fair_up_prob, edge
+
+
+class CheckOpportunityFloatTest(unittest.TestCase):
+    
+    ITERATIONS = 1000
+    
+    # Bin bounds and the minimum move, so exact ties get exercised
+    BOUNDARY_MOVES = (0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 100.0)
+    
+    def _random_price(self, rng: random.Random) -> Decimal:
+        return Decimal(rng.randint(1, 99)) / 100
+    
+    def test_matches_decimal_path(self):
+        rng = random.Random(1234)
+        feed = _FakeSpotFeed()
+        min_edge = Decimal("0.02")
+        min_spot_move = Decimal("0.1")
+        detector = SpotLagDetector(feed, min_edge=min_edge, min_spot_move=min_spot_move)
+        detector.register_market("btcusdt", "cond", "up", "down")
+        
+        signals = 0
+        for _ in range(self.ITERATIONS):
+            if rng.random() < 0.2:
+                change_pct = rng.choice(self.BOUNDARY_MOVES) * rng.choice((1, -1))
+            else:
+                change_pct = round(rng.uniform(-3, 3), 4)
+            feed.data = SpotData(
+                symbol="btcusdt",
+                price=100.0,
+                open_price=100.0,
+                change_pct=change_pct,
+                timestamp_ns=time.monotonic_ns(),
+            )
+            up_bid, up_ask = sorted((self._random_price(rng), self._random_price(rng)))
+            down_bid, down_ask = sorted((self._random_price(rng), self._random_price(rng)))
+            detector.update_pm_prices("btcusdt", up_bid, up_ask, down_bid, down_ask)
+            up_price, down_price = detector._pm_prices["btcusdt"]
+            
+            signal = detector.check_opportunity("btcusdt")
+            expected = _decimal_reference(
+                Decimal(str(change_pct)), up_price, down_price, min_edge, min_spot_move,
+            )
+            
+            if expected is None:
+                self.assertIsNone(signal, change_pct)
+                continue
+            signals += 1
+            direction, fair_up_prob, edge = expected
+            self.assertIsNotNone(signal, change_pct)
+            self.assertEqual(signal.direction, direction)
+            self.assertEqual(signal.fair_up_prob.quantize(Decimal("0.000001")),
+                             fair_up_prob.quantize(Decimal("0.000001")))
+            self.assertEqual(signal.edge.quantize(Decimal("0.000001")),
+                             edge.quantize(Decimal("0.000001")))
+        
+        # Both branches of the comparison must actually be exercised
+        self.assertGreater(signals, 0)
+        self.assertLess(signals, self.ITERATIONS)
+
+
+if __name__ == "__main__":
+    unittest.main()
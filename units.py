@@ -0,0 +1,20 @@
+"""
+Fixed-point helpers for hot-path arithmetic.
+Prices and USDC amounts are scaled to integer micro-units (1e-6).
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+SCALE = 1_000_000  # micro-units per unit (USDC has 6 decimals)
+
+_SCALE_D = Decimal(SCALE)
+
+
+def to_micros(value: Decimal) -> int:
+    """Convert a Decimal amount to integer micro-units."""
+    return int((value * _SCALE_D).to_integral_value(ROUND_HALF_EVEN))
+
+
+def from_micros(value: int) -> Decimal:
+    """Convert integer micro-units back to a Decimal amount."""
+    return Decimal(value) / _SCALE_D